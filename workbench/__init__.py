@@ -16,7 +16,12 @@ Example usage:
     )
 """
 
-from workbench.client import WorkbenchClient, WorkbenchError
+from workbench.client import (
+    AsyncWorkbenchClient,
+    WorkbenchClient,
+    WorkbenchError,
+    WorkbenchUnavailable,
+)
 from workbench.webhooks import (
     verify_webhook_signature,
     construct_webhook_event,
@@ -54,13 +59,18 @@ from workbench.types import (
     ServiceRequest,
     ServiceRequestStatus,
     ServiceRequestPriority,
+    SERVICE_REQUEST_STATUSES,
+    SERVICE_REQUEST_PRIORITIES,
     CreateServiceRequestParams,
     UpdateServiceRequestParams,
     ListServiceRequestsParams,
     # Webhook types
     Webhook,
     WebhookDelivery,
+    WebhookDeliveryStatus,
+    WEBHOOK_DELIVERY_STATUSES,
     WebhookEvent,
+    WEBHOOK_EVENTS,
     CreateWebhookParams,
     UpdateWebhookParams,
     # Notification types
@@ -74,14 +84,22 @@ from workbench.types import (
     # Response types
     ApiResponse,
     ListResponse,
+    UnpaginatedListResponse,
+    LazyListResponse,
+    LazyList,
     Pagination,
+    BulkResponse,
+    BulkItemResult,
+    BulkItemError,
 )
 
 __version__ = "1.2.1"
 __all__ = [
     # Main client
     "WorkbenchClient",
+    "AsyncWorkbenchClient",
     "WorkbenchError",
+    "WorkbenchUnavailable",
     # Webhook utilities
     "verify_webhook_signature",
     "construct_webhook_event",
@@ -113,12 +131,17 @@ __all__ = [
     "ServiceRequest",
     "ServiceRequestStatus",
     "ServiceRequestPriority",
+    "SERVICE_REQUEST_STATUSES",
+    "SERVICE_REQUEST_PRIORITIES",
     "CreateServiceRequestParams",
     "UpdateServiceRequestParams",
     "ListServiceRequestsParams",
     "Webhook",
     "WebhookDelivery",
+    "WebhookDeliveryStatus",
+    "WEBHOOK_DELIVERY_STATUSES",
     "WebhookEvent",
+    "WEBHOOK_EVENTS",
     "CreateWebhookParams",
     "UpdateWebhookParams",
     # Notification types
@@ -132,5 +155,11 @@ __all__ = [
     # Response types
     "ApiResponse",
     "ListResponse",
+    "UnpaginatedListResponse",
+    "LazyListResponse",
+    "LazyList",
     "Pagination",
+    "BulkResponse",
+    "BulkItemResult",
+    "BulkItemError",
 ]
@@ -0,0 +1,99 @@
+"""
+Circuit breaker for the Workbench API.
+
+When the API keeps failing, the breaker "opens" and requests fail
+immediately instead of each one waiting for its own timeout. After a
+cooldown, one probe request is let through: if it succeeds the breaker
+closes again, otherwise it stays open for another cooldown.
+"""
+
+import threading
+import time
+from typing import Literal, Optional
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RECOVERY_TIME = 30.0
+
+
+class CircuitBreaker:
+    """
+    Thread-safe CLOSED/OPEN/HALF_OPEN circuit breaker.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit
+        recovery_time: Seconds to stay open before allowing a probe request
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_time: float = DEFAULT_RECOVERY_TIME,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self._state: CircuitState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open circuit reads as half_open once it may be probed."""
+        with self._lock:
+            if self._state == "open" and self._cooldown_elapsed():
+                return "half_open"
+            return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit allows another probe request."""
+        with self._lock:
+            if self._state == "open":
+                resume_at = self._opened_at + self.recovery_time
+            elif self._state == "half_open" and self._probe_started_at is not None:
+                # The probe in flight reports back (or is given up on) by then
+                resume_at = self._probe_started_at + self.recovery_time
+            else:
+                return 0.0
+            return max(0.0, resume_at - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Determine if a request may be sent, claiming the probe slot if half-open."""
+        with self._lock:
+            if self._state == "closed":
+                return True
+            if self._state == "open":
+                if not self._cooldown_elapsed():
+                    return False
+                self._state = "half_open"
+            # Half-open: one probe at a time. A probe that never reported back
+            # (e.g. a cancelled task) is given up on after one recovery period.
+            now = time.monotonic()
+            if (
+                self._probe_started_at is not None
+                and now - self._probe_started_at < self.recovery_time
+            ):
+                return False
+            self._probe_started_at = now
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            self._state = "closed"
+            self._failures = 0
+            self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            if self._state == "half_open" or self._failures >= self.failure_threshold:
+                self._state = "open"
+                self._opened_at = time.monotonic()
+                self._probe_started_at = None
+
+    def _cooldown_elapsed(self) -> bool:
+        return time.monotonic() - self._opened_at >= self.recovery_time
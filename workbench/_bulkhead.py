@@ -0,0 +1,98 @@
+"""
+Bulkheads limiting concurrent calls through a resource.
+
+Each resource gets its own bulkhead, so a workload that floods one resource
+(e.g. thousands of concurrent service request updates) queues behind its own
+limit instead of taking every connection from the shared pool.
+"""
+
+import asyncio
+import threading
+from typing import Any, Optional
+
+DEFAULT_MAX_CONCURRENT = 16
+
+
+class Bulkhead:
+    """
+    Context manager allowing at most ``max_concurrent`` threads inside at once.
+
+    Args:
+        max_concurrent: Maximum number of concurrent calls
+    """
+
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_CONCURRENT):
+        self.max_concurrent = max_concurrent
+        self._semaphore = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._queued = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently running."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting for a free slot."""
+        return self._queued
+
+    def __enter__(self) -> "Bulkhead":
+        with self._lock:
+            self._queued += 1
+        try:
+            self._semaphore.acquire()
+        finally:
+            with self._lock:
+                self._queued -= 1
+        with self._lock:
+            self._in_flight += 1
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._semaphore.release()
+
+
+class AsyncBulkhead:
+    """
+    Async context manager allowing at most ``max_concurrent`` tasks inside at once.
+
+    Args:
+        max_concurrent: Maximum number of concurrent calls
+    """
+
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_CONCURRENT):
+        self.max_concurrent = max_concurrent
+        # Created on first use so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+        self._queued = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently running."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting for a free slot."""
+        return self._queued
+
+    async def __aenter__(self) -> "AsyncBulkhead":
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._queued += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+        self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self._in_flight -= 1
+        assert self._semaphore is not None
+        self._semaphore.release()
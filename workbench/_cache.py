@@ -0,0 +1,75 @@
+"""
+In-memory response cache used for conditional GET requests.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed time-to-live.
+
+    Both the number of entries and their total size are bounded, so a few
+    large responses can't keep an unbounded amount of memory alive.
+
+    Args:
+        maxsize: Maximum number of entries; the least recently used entry is
+            evicted when full
+        ttl: Seconds an entry stays valid after it was last stored
+        max_bytes: Maximum total size of all entries, as reported by the
+            ``size`` passed to ``set``; larger entries are not stored
+    """
+
+    def __init__(self, maxsize: int, ttl: float, max_bytes: int):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, int, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total size of the stored entries."""
+        return self._bytes
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, _, value = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, size: int = 0) -> None:
+        """Store ``value`` (taking ``size`` bytes) under ``key``, evicting old entries if needed."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self._max_bytes:
+                return
+            self._entries[key] = (time.monotonic() + self._ttl, size, value)
+            self._bytes += size
+            while len(self._entries) > self._maxsize or self._bytes > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
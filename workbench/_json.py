@@ -0,0 +1,189 @@
+"""
+JSON encoding and decoding for API payloads.
+
+Request bodies are encoded with orjson (or msgspec) and responses decoded
+with msgspec when they are installed (``pip install workbench-sdk[speedups]``);
+the standard library is used otherwise. Decoding gives the same plain dicts
+and lists either way. Every encoder accepts the same inputs: JSON types
+(including non-string dict keys and arbitrarily large ints) plus dates,
+times, UUIDs, enums, decimals and dataclasses. The output may differ in
+formatting details, e.g. msgspec writes UTC offsets as ``Z`` rather than
+``+00:00``.
+
+Streaming responses are parsed incrementally with ijson when it is
+installed, so only one array item at a time has to be held in memory.
+"""
+
+import dataclasses
+import datetime
+import decimal
+import enum
+import json
+import uuid
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+if msgspec is not None:
+    _decoder = msgspec.json.Decoder()
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decode a JSON document."""
+        return _decoder.decode(data)
+
+else:
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decode a JSON document."""
+        return json.loads(data)
+
+
+def _unchanged(item: Any) -> Any:
+    return item
+
+
+if msgspec is not None:
+    _fields_decoder = msgspec.json.Decoder(Dict[str, msgspec.Raw])
+    _items_decoder = msgspec.json.Decoder(Optional[List[msgspec.Raw]])
+
+    def loads_deferred_array(
+        data: bytes, key: str
+    ) -> Tuple[Dict[str, Any], List[Any], Callable[[Any], Any]]:
+        """
+        Decode a JSON object, leaving the items of its ``key`` array encoded.
+
+        Returns the object's other fields, the still-encoded items and the
+        function that decodes one item. Without msgspec the whole document is
+        decoded up front and that function returns items unchanged.
+
+        Args:
+            data: JSON document
+            key: Name of the top-level array (e.g. "data")
+        """
+        fields = _fields_decoder.decode(data)
+        raw_items = fields.pop(key, None)
+        items = _items_decoder.decode(raw_items) if raw_items is not None else None
+        decoded = {name: _decoder.decode(value) for name, value in fields.items()}
+        return decoded, items or [], _decoder.decode
+
+else:
+
+    def loads_deferred_array(
+        data: bytes, key: str
+    ) -> Tuple[Dict[str, Any], List[Any], Callable[[Any], Any]]:
+        """Decode a JSON object; its ``key`` array is decoded up front without msgspec."""
+        fields = json.loads(data)
+        return fields, fields.pop(key, None) or [], _unchanged
+
+
+def _default(obj: Any) -> Any:
+    """Convert the non-JSON types orjson and msgspec support for the stdlib encoder."""
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, (uuid.UUID, decimal.Decimal)):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_stdlib(obj: Any) -> bytes:
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
+
+
+if orjson is not None:
+
+    def dumps(obj: Any) -> bytes:
+        """Encode ``obj`` as a UTF-8 JSON document."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Ints wider than 64 bits, decimals, ...
+            return _dumps_stdlib(obj)
+
+elif msgspec is not None:
+    _encoder = msgspec.json.Encoder()
+
+    def dumps(obj: Any) -> bytes:
+        """Encode ``obj`` as a UTF-8 JSON document."""
+        try:
+            return _encoder.encode(obj)
+        except TypeError:
+            return _dumps_stdlib(obj)
+
+else:
+    dumps = _dumps_stdlib
+
+
+def iter_array_items(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """
+    Yield the items of the top-level ``key`` array of a streamed JSON object.
+
+    Items are yielded as soon as they are complete. Without ijson the whole
+    body is buffered and decoded first.
+
+    Args:
+        chunks: Raw body chunks, in order
+        key: Name of the top-level array (e.g. "data")
+    """
+    if ijson is None:
+        yield from loads(b"".join(chunks)).get(key) or []
+        return
+
+    items: List[Any] = ijson.sendable_list()
+    parser = ijson.items_coro(items, f"{key}.item", use_float=True)
+    for chunk in chunks:
+        parser.send(chunk)
+        yield from items
+        del items[:]
+    parser.close()
+    yield from items
+
+
+async def aiter_array_items(chunks: AsyncIterable[bytes], key: str) -> AsyncIterator[Any]:
+    """Async version of ``iter_array_items``."""
+    if ijson is None:
+        body = b"".join([chunk async for chunk in chunks])
+        for item in loads(body).get(key) or []:
+            yield item
+        return
+
+    items: List[Any] = ijson.sendable_list()
+    parser = ijson.items_coro(items, f"{key}.item", use_float=True)
+    async for chunk in chunks:
+        parser.send(chunk)
+        for item in items:
+            yield item
+        del items[:]
+    parser.close()
+    for item in items:
+        yield item
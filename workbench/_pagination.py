@@ -0,0 +1,98 @@
+"""
+Auto-pagination helpers for list endpoints.
+
+Resource ``iter_*`` methods use these helpers to walk every page of a list
+endpoint while the caller consumes items one at a time.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def has_more(response: Dict[str, Any], page: int) -> bool:
+    """
+    Determine whether a list response has a page after ``page``.
+
+    Uses ``has_more`` or ``total_pages`` when present, otherwise ``total``
+    with the page size (or offset and limit). Without any of these, pages
+    are fetched until one comes back empty.
+    """
+    pagination = response.get("pagination") or {}
+    if "has_more" in pagination:
+        return bool(pagination["has_more"])
+    if "total_pages" in pagination:
+        return bool(page < pagination["total_pages"])
+    total = pagination.get("total")
+    if total is not None:
+        if "offset" in pagination and "limit" in pagination:
+            return bool(pagination["offset"] + pagination["limit"] < total)
+        page_size = pagination.get("per_page") or pagination.get("limit")
+        if page_size:
+            return bool(page * page_size < total)
+    return bool(response.get("data"))
+
+
+def iter_pages(fetch: Callable[[int], Dict[str, Any]]) -> Iterator[Any]:
+    """
+    Yield the items of every page returned by ``fetch``.
+
+    While the caller processes the items of page N, page N+1 is requested on
+    a background thread, so the round-trip for the next page overlaps with
+    the caller's work instead of following it.
+
+    Args:
+        fetch: Callable returning the list response for a 1-indexed page
+
+    Yields:
+        Items from each page, in order
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="workbench-pagination")
+    try:
+        page = 1
+        response = fetch(page)
+        while True:
+            next_page = executor.submit(fetch, page + 1) if has_more(response, page) else None
+            yield from response.get("data") or []
+            if next_page is None:
+                return
+            response = next_page.result()
+            page += 1
+    finally:
+        # Don't block an abandoned iterator on a prefetch nobody will read
+        executor.shutdown(wait=False)
+
+
+async def aiter_pages(fetch: Callable[[int], Awaitable[Dict[str, Any]]]) -> AsyncIterator[Any]:
+    """
+    Async version of ``iter_pages``.
+
+    Page N+1 is requested as a separate task before the items of page N are
+    yielded, so its round-trip overlaps with the caller's work.
+
+    Args:
+        fetch: Coroutine function returning the list response for a 1-indexed page
+
+    Yields:
+        Items from each page, in order
+    """
+    page = 1
+    response = await fetch(page)
+    next_page: Optional["asyncio.Future[Dict[str, Any]]"] = None
+    try:
+        while True:
+            next_page = (
+                asyncio.ensure_future(fetch(page + 1)) if has_more(response, page) else None
+            )
+            for item in response.get("data") or []:
+                yield item
+            if next_page is None:
+                return
+            response = await next_page
+            next_page = None
+            page += 1
+    finally:
+        if next_page is not None:
+            next_page.cancel()
@@ -0,0 +1,73 @@
+"""
+Retry policy for transient API failures.
+
+Both clients retry with exponential backoff plus random jitter, so many
+clients failing at the same moment don't retry in lockstep. Only failures
+that are safe to repeat are retried:
+
+- 429 responses, for any method (the server rejected the request unprocessed)
+- 502/503/504 responses and timeouts, for idempotent methods only
+- Connection failures, for any method (the request never reached the server)
+
+Validation, authentication and other 4xx errors are never retried.
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+RETRY_JITTER = 0.5
+
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def is_retryable_status(method: str, status: int) -> bool:
+    """Determine if a response status is worth retrying for ``method``."""
+    if status == 429:
+        return True
+    return status in RETRYABLE_STATUSES and method.upper() in IDEMPOTENT_METHODS
+
+
+def is_retryable_error(method: str, error: httpx.RequestError) -> bool:
+    """Determine if a transport error is worth retrying for ``method``."""
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return True
+    return method.upper() in IDEMPOTENT_METHODS
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into a delay in seconds.
+
+    Accepts both forms allowed by RFC 9110: a number of seconds or an
+    HTTP date. Returns None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Calculate the delay before retry number ``attempt`` (0-indexed).
+
+    A server-provided Retry-After wins when present. Both are capped at
+    RETRY_MAX_DELAY.
+    """
+    if retry_after is not None:
+        return min(retry_after, RETRY_MAX_DELAY)
+    backoff = min(RETRY_BASE_DELAY * 2.0**attempt, RETRY_MAX_DELAY)
+    return backoff + random.uniform(0, RETRY_JITTER)
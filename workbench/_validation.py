@@ -0,0 +1,33 @@
+"""
+Client-side checks for enum-like arguments.
+
+A typo in a status or event name is caught before the request is sent,
+instead of costing a round-trip that ends in a 422.
+"""
+
+from typing import AbstractSet, Iterable, Optional
+
+
+def check_choice(name: str, value: Optional[str], choices: AbstractSet[str]) -> None:
+    """
+    Raise ValueError if ``value`` is set and not one of ``choices``.
+
+    Args:
+        name: Argument name, used in the error message
+        value: Value to check (None is always accepted)
+        choices: Allowed values
+    """
+    if value is not None and value not in choices:
+        raise ValueError(
+            f"Invalid {name} {value!r}; expected one of: {', '.join(sorted(choices))}"
+        )
+
+
+def check_choices(
+    name: str, values: Optional[Iterable[str]], choices: AbstractSet[str]
+) -> None:
+    """Like ``check_choice``, for every item of ``values``."""
+    if values is None:
+        return
+    for value in values:
+        check_choice(name, value, choices)
@@ -6,10 +6,39 @@ Workbench CRM API. It handles authentication, request management, and
 provides access to all API resources.
 """
 
+import asyncio
 import time
-from typing import Any, Dict, Optional, TypeVar, Union
+from contextlib import asynccontextmanager, contextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 import httpx
 
+from workbench._breaker import (
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_RECOVERY_TIME,
+    CircuitBreaker,
+    CircuitState,
+)
+from workbench._bulkhead import DEFAULT_MAX_CONCURRENT
+from workbench._cache import ResponseCache
+from workbench._json import dumps as json_dumps, loads as json_loads
+from workbench._retry import (
+    is_retryable_error,
+    is_retryable_status,
+    parse_retry_after,
+    retry_delay,
+)
+
 from workbench.resources.clients import ClientsResource
 from workbench.resources.invoices import InvoicesResource
 from workbench.resources.quotes import QuotesResource
@@ -18,12 +47,27 @@ from workbench.resources.requests import RequestsResource
 from workbench.resources.webhooks import WebhooksResource
 from workbench.resources.notifications import NotificationsResource
 from workbench.resources.integrations import IntegrationsResource
+from workbench.resources.requests_async import AsyncRequestsResource
+from workbench.resources.webhooks_async import AsyncWebhooksResource
 
 T = TypeVar("T")
 
 DEFAULT_BASE_URL = "https://api.tryworkbench.app"
 DEFAULT_TIMEOUT = 30.0
+# Connecting should be quick; a short connect timeout fails fast on an
+# unreachable host while the read timeout leaves room for slow responses
+DEFAULT_CONNECT_TIMEOUT = 5.0
 DEFAULT_MAX_RETRIES = 3
+DEFAULT_MAX_CONNECTIONS = 50
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+# Keep idle connections longer than httpx's 5s default so calls spaced a few
+# seconds apart still reuse a warm connection instead of a new TLS handshake
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_MAX_CONCURRENCY = 20
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_TTL = 60.0
+DEFAULT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_WARMUP_TIMEOUT = 5.0
 
 
 class WorkbenchError(Exception):
@@ -52,7 +96,163 @@ class WorkbenchError(Exception):
         return " ".join(parts)
 
 
-class WorkbenchClient:
+class WorkbenchUnavailable(WorkbenchError):
+    """
+    Error raised without contacting the API while its circuit breaker is open.
+
+    The client opens the circuit after repeated server errors or timeouts,
+    and fails fast until ``retry_after`` seconds have passed.
+    """
+
+    def __init__(self, retry_after: float):
+        super().__init__(
+            f"Workbench API unavailable, retry in {retry_after:.0f}s", code="CIRCUIT_OPEN"
+        )
+        self.retry_after = retry_after
+
+
+class _BaseClient:
+    """Configuration and response handling shared by the sync and async clients."""
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        access_token: Optional[str],
+        base_url: str,
+        timeout: float,
+        max_retries: int,
+        cache_size: int,
+        cache_ttl: float,
+        cache_max_bytes: int,
+        circuit_failure_threshold: int,
+        circuit_recovery_time: float,
+    ):
+        if not api_key and not access_token:
+            raise ValueError("Either api_key or access_token must be provided")
+
+        self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._max_retries = max_retries
+        self._auth_header = f"Bearer {access_token or api_key}"
+        # ETag-validated GET responses: {(path, params): (etag, body)}
+        self._cache = (
+            ResponseCache(cache_size, cache_ttl, cache_max_bytes) if cache_size > 0 else None
+        )
+        self._breaker = CircuitBreaker(circuit_failure_threshold, circuit_recovery_time)
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        """State of the API circuit breaker: "closed", "open" or "half_open"."""
+        return self._breaker.state
+
+    def _http_options(
+        self, max_connections: int, max_keepalive_connections: int, http2: bool
+    ) -> Dict[str, Any]:
+        """Build the keyword arguments for the underlying httpx client."""
+        return {
+            "base_url": self._base_url,
+            "http2": http2,
+            "timeout": httpx.Timeout(self._timeout, connect=DEFAULT_CONNECT_TIMEOUT),
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+            ),
+            "headers": {
+                "Authorization": self._auth_header,
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+        }
+
+    def _check_circuit(self) -> None:
+        """Fail fast if the circuit breaker is open."""
+        if not self._breaker.allow_request():
+            raise WorkbenchUnavailable(self._breaker.retry_after())
+
+    def _record_status(self, status: int) -> None:
+        """Report a response to the circuit breaker; only 5xx count as failures."""
+        if status >= 500:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+
+    def _request_timeout(self, timeout: Optional[float]) -> Any:
+        """Resolve a per-call timeout; None keeps the client default."""
+        if timeout is None:
+            return httpx.USE_CLIENT_DEFAULT
+        return httpx.Timeout(timeout, connect=min(timeout, DEFAULT_CONNECT_TIMEOUT))
+
+    def _get_retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Calculate jittered exponential backoff, honoring Retry-After if present."""
+        retry_after = None
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return retry_delay(attempt, retry_after)
+
+    def _is_retryable(self, method: str, status: int) -> bool:
+        """Determine if an error response is retryable."""
+        return is_retryable_status(method, status)
+
+    def _cache_key(
+        self, method: str, path: str, params: Optional[Dict[str, Any]]
+    ) -> Optional[Hashable]:
+        """Return the response cache key for a request, or None if it isn't cacheable."""
+        if method != "GET" or self._cache is None:
+            return None
+        return (path, tuple(sorted((k, str(v)) for k, v in params.items())) if params else ())
+
+    def _cached_response(self, cache_key: Optional[Hashable]) -> Optional[Tuple[str, bytes]]:
+        """Look up the cached (etag, body) pair for a request."""
+        if cache_key is None or self._cache is None:
+            return None
+        return self._cache.get(cache_key)
+
+    def _conditional_headers(
+        self, cached: Optional[Tuple[str, bytes]]
+    ) -> Optional[Dict[str, str]]:
+        """Build the If-None-Match header for a cached response."""
+        return {"If-None-Match": cached[0]} if cached else None
+
+    def _store_response(self, cache_key: Optional[Hashable], response: httpx.Response) -> None:
+        """Cache a successful GET response if the server sent an ETag."""
+        if cache_key is None or self._cache is None:
+            return
+        etag = response.headers.get("ETag")
+        if etag:
+            self._cache.set(cache_key, (etag, response.content), len(response.content))
+
+    def _revalidated(
+        self,
+        cache_key: Optional[Hashable],
+        cached: Tuple[str, bytes],
+        decode: Callable[[bytes], Any],
+    ) -> Any:
+        """Handle a 304 response: keep the cached entry fresh and return its body."""
+        if cache_key is not None and self._cache is not None:
+            self._cache.set(cache_key, cached, len(cached[1]))
+        return decode(cached[1])
+
+    def _error_from_response(self, response: httpx.Response) -> WorkbenchError:
+        """Build a WorkbenchError from an unsuccessful response."""
+        try:
+            error_data = json_loads(response.content)
+            error_info = error_data.get("error", {})
+            meta = error_data.get("meta", {})
+        except Exception:
+            error_info = {}
+            meta = {}
+
+        return WorkbenchError(
+            message=error_info.get("message", "Unknown error"),
+            status=response.status_code,
+            code=error_info.get("code", "UNKNOWN_ERROR"),
+            details=error_info.get("details"),
+            request_id=meta.get("request_id"),
+        )
+
+
+class WorkbenchClient(_BaseClient):
     """
     Main Workbench API client.
 
@@ -84,37 +284,73 @@ class WorkbenchClient:
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        http2: bool = True,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        circuit_failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        circuit_recovery_time: float = DEFAULT_RECOVERY_TIME,
+        max_concurrent_per_resource: int = DEFAULT_MAX_CONCURRENT,
+        warmup: bool = False,
     ):
         """
         Initialize the Workbench client.
 
+        All requests made through the client share one connection pool, so
+        keep-alive connections are reused across calls. Reuse a single client
+        instead of creating one per request, and close it when done.
+
         Args:
             api_key: API key for authentication (wbk_live_xxx or wbk_test_xxx)
             access_token: OAuth access token for third-party app authentication
             base_url: Base URL for the API (default: https://api.tryworkbench.app)
-            timeout: Request timeout in seconds (default: 30)
+            timeout: Default request timeout in seconds; individual calls can
+                override it with their own ``timeout`` argument (default: 30)
             max_retries: Maximum number of retries for failed requests (default: 3)
+            max_connections: Maximum number of open connections (default: 50)
+            max_keepalive_connections: Maximum number of idle connections kept
+                alive for reuse (default: 20)
+            http2: Use HTTP/2 when the server supports it, so concurrent
+                requests are multiplexed over one connection (default: True)
+            cache_size: Maximum number of GET responses kept for conditional
+                requests (If-None-Match); 0 disables the cache (default: 1024)
+            cache_ttl: Seconds a cached GET response is kept (default: 60)
+            cache_max_bytes: Maximum total size of the cached response bodies;
+                larger bodies are not cached (default: 16 MiB)
+            circuit_failure_threshold: Consecutive calls failing with a server
+                error or timeout (after retries) after which requests fail
+                fast with WorkbenchUnavailable (default: 5)
+            circuit_recovery_time: Seconds to fail fast before letting a
+                probe request through (default: 30)
+            max_concurrent_per_resource: Maximum number of calls in flight
+                through the service request and webhook resources, each
+                counted separately (default: 16)
+            warmup: Open a connection to the API right away (see ``warmup``),
+                so the first real request doesn't pay for the TLS handshake
+                (default: False)
 
         Raises:
             ValueError: If neither api_key nor access_token is provided
         """
-        if not api_key and not access_token:
-            raise ValueError("Either api_key or access_token must be provided")
-
-        self._base_url = base_url.rstrip("/")
-        self._timeout = timeout
-        self._max_retries = max_retries
-        self._auth_header = f"Bearer {access_token or api_key}"
+        super().__init__(
+            api_key,
+            access_token,
+            base_url,
+            timeout,
+            max_retries,
+            cache_size,
+            cache_ttl,
+            cache_max_bytes,
+            circuit_failure_threshold,
+            circuit_recovery_time,
+        )
 
-        # Initialize HTTP client
+        # Initialize HTTP client (one shared keep-alive connection pool,
+        # multiplexed over HTTP/2 when the server supports it)
         self._http = httpx.Client(
-            base_url=self._base_url,
-            timeout=timeout,
-            headers={
-                "Authorization": self._auth_header,
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            },
+            **self._http_options(max_connections, max_keepalive_connections, http2)
         )
 
         # Initialize resources
@@ -122,11 +358,28 @@ class WorkbenchClient:
         self.invoices = InvoicesResource(self)
         self.quotes = QuotesResource(self)
         self.jobs = JobsResource(self)
-        self.requests = RequestsResource(self)
-        self.webhooks = WebhooksResource(self)
+        self.requests = RequestsResource(self, max_concurrent_per_resource)
+        self.webhooks = WebhooksResource(self, max_concurrent_per_resource)
         self.notifications = NotificationsResource(self)
         self.integrations = IntegrationsResource(self)
 
+        if warmup:
+            self.warmup()
+
+    def warmup(self) -> None:
+        """
+        Open a keep-alive connection to the API ahead of the first request.
+
+        Sends a cheap HEAD request to the base URL so the connection setup
+        (DNS, TCP and TLS handshakes) is done now rather than on the first
+        real call. Best-effort: failures are ignored, and the request bypasses
+        retries and the circuit breaker.
+        """
+        try:
+            self._http.head("/", timeout=DEFAULT_WARMUP_TIMEOUT)
+        except httpx.HTTPError:
+            pass
+
     def close(self) -> None:
         """Close the HTTP client."""
         self._http.close()
@@ -137,20 +390,14 @@ class WorkbenchClient:
     def __exit__(self, *args: Any) -> None:
         self.close()
 
-    def _get_retry_delay(self, attempt: int) -> float:
-        """Calculate exponential backoff delay."""
-        return min(1.0 * (2**attempt), 10.0)
-
-    def _is_retryable(self, status: int) -> bool:
-        """Determine if an error is retryable."""
-        return status == 429 or (status >= 500 and status < 600)
-
     def request(
         self,
         method: str,
         path: str,
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        decode: Optional[Callable[[bytes], Any]] = None,
     ) -> Dict[str, Any]:
         """
         Make an API request.
@@ -160,9 +407,13 @@ class WorkbenchClient:
             path: Request path (without base URL)
             params: Query parameters
             json: Request body
+            timeout: Timeout in seconds for this request (default: the
+                client's timeout)
+            decode: Turns the raw response body into the return value
+                (default: JSON decoding into a dictionary)
 
         Returns:
-            API response as a dictionary
+            API response as a dictionary (or whatever ``decode`` returns)
 
         Raises:
             WorkbenchError: If the request fails
@@ -171,6 +422,15 @@ class WorkbenchClient:
         if params:
             params = {k: v for k, v in params.items() if v is not None}
 
+        cache_key = self._cache_key(method, path, params)
+        cached = self._cached_response(cache_key)
+        # Serialized once, outside the retry loop
+        content = json_dumps(json) if json is not None else None
+        if decode is None:
+            decode = json_loads
+
+        # The breaker sees each call once, however many attempts it takes
+        self._check_circuit()
         last_error: Optional[Exception] = None
 
         for attempt in range(self._max_retries + 1):
@@ -179,76 +439,448 @@ class WorkbenchClient:
                     method=method,
                     url=path,
                     params=params,
-                    json=json,
+                    content=content,
+                    headers=self._conditional_headers(cached),
+                    timeout=self._request_timeout(timeout),
                 )
 
+                # Unchanged since the cached copy: reuse its body
+                if response.status_code == 304 and cached is not None:
+                    self._record_status(response.status_code)
+                    return self._revalidated(  # type: ignore[no-any-return]
+                        cache_key, cached, decode
+                    )
+
                 # Handle error responses
                 if not response.is_success:
-                    try:
-                        error_data = response.json()
-                        error_info = error_data.get("error", {})
-                        meta = error_data.get("meta", {})
-                    except Exception:
-                        error_info = {}
-                        meta = {}
-
                     # Check if retryable
-                    if self._is_retryable(response.status_code) and attempt < self._max_retries:
-                        delay = self._get_retry_delay(attempt)
-                        time.sleep(delay)
+                    if (
+                        self._is_retryable(method, response.status_code)
+                        and attempt < self._max_retries
+                    ):
+                        time.sleep(self._get_retry_delay(attempt, response))
                         continue
 
-                    raise WorkbenchError(
-                        message=error_info.get("message", "Unknown error"),
-                        status=response.status_code,
-                        code=error_info.get("code", "UNKNOWN_ERROR"),
-                        details=error_info.get("details"),
-                        request_id=meta.get("request_id"),
-                    )
+                    self._record_status(response.status_code)
+                    raise self._error_from_response(response)
+
+                self._record_status(response.status_code)
 
                 # Parse successful response
                 if response.status_code == 204:
                     return {}
 
-                return response.json()
+                self._store_response(cache_key, response)
+                return decode(response.content)  # type: ignore[no-any-return]
 
-            except httpx.TimeoutException:
+            except httpx.TimeoutException as e:
                 last_error = WorkbenchError("Request timeout", code="TIMEOUT")
-                if attempt < self._max_retries:
-                    delay = self._get_retry_delay(attempt)
-                    time.sleep(delay)
+                if attempt < self._max_retries and is_retryable_error(method, e):
+                    time.sleep(self._get_retry_delay(attempt))
                     continue
+                break
 
             except httpx.RequestError as e:
                 last_error = WorkbenchError(str(e), code="REQUEST_ERROR")
-                if attempt < self._max_retries:
-                    delay = self._get_retry_delay(attempt)
-                    time.sleep(delay)
+                if attempt < self._max_retries and is_retryable_error(method, e):
+                    time.sleep(self._get_retry_delay(attempt))
                     continue
+                break
 
         if last_error:
+            self._breaker.record_failure()
             raise last_error
 
         raise WorkbenchError("Request failed", code="UNKNOWN_ERROR")
 
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[httpx.Response]:
+        """
+        Make a streaming API request.
+
+        The response body is not read up front: iterate over it inside the
+        ``with`` block. Streaming requests bypass the response cache and are
+        not retried, but they do go through the circuit breaker.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            path: Request path (without base URL)
+            params: Query parameters
+            timeout: Timeout in seconds for this request (default: the
+                client's timeout)
+
+        Yields:
+            The streaming HTTP response
+
+        Raises:
+            WorkbenchError: If the request fails
+        """
+        # Filter out None values from params
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+
+        self._check_circuit()
+        try:
+            with self._http.stream(
+                method, path, params=params, timeout=self._request_timeout(timeout)
+            ) as response:
+                self._record_status(response.status_code)
+                if not response.is_success:
+                    response.read()
+                    raise self._error_from_response(response)
+                yield response
+        except httpx.TimeoutException as e:
+            self._breaker.record_failure()
+            raise WorkbenchError("Request timeout", code="TIMEOUT") from e
+        except httpx.RequestError as e:
+            self._breaker.record_failure()
+            raise WorkbenchError(str(e), code="REQUEST_ERROR") from e
+
     def get(
-        self, path: str, params: Optional[Dict[str, Any]] = None
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        decode: Optional[Callable[[bytes], Any]] = None,
     ) -> Dict[str, Any]:
         """Make a GET request."""
-        return self.request("GET", path, params=params)
+        return self.request("GET", path, params=params, timeout=timeout, decode=decode)
 
     def post(
-        self, path: str, json: Optional[Dict[str, Any]] = None
+        self,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Make a POST request."""
-        return self.request("POST", path, json=json)
+        return self.request("POST", path, json=json, timeout=timeout)
 
     def put(
-        self, path: str, json: Optional[Dict[str, Any]] = None
+        self,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Make a PUT request."""
+        return self.request("PUT", path, json=json, timeout=timeout)
+
+    def delete(self, path: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Make a DELETE request."""
+        return self.request("DELETE", path, timeout=timeout)
+
+
+class AsyncWorkbenchClient(_BaseClient):
+    """
+    Asynchronous Workbench API client.
+
+    Provides async versions of the service request and webhook resources,
+    so many calls can be in flight at once over the shared connection pool.
+
+    Example:
+        >>> import asyncio
+        >>> from workbench import AsyncWorkbenchClient
+        >>>
+        >>> async def main():
+        ...     async with AsyncWorkbenchClient(api_key="wbk_live_xxx") as client:
+        ...         await asyncio.gather(*[
+        ...             client.requests.update(id, status="completed") for id in ids
+        ...         ])
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        access_token: Optional[str] = None,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        http2: bool = True,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        circuit_failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        circuit_recovery_time: float = DEFAULT_RECOVERY_TIME,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_concurrent_per_resource: Optional[int] = None,
+    ):
+        """
+        Initialize the async Workbench client.
+
+        Args:
+            api_key: API key for authentication (wbk_live_xxx or wbk_test_xxx)
+            access_token: OAuth access token for third-party app authentication
+            base_url: Base URL for the API (default: https://api.tryworkbench.app)
+            timeout: Default request timeout in seconds; individual calls can
+                override it with their own ``timeout`` argument (default: 30)
+            max_retries: Maximum number of retries for failed requests (default: 3)
+            max_connections: Maximum number of open connections (default: 50)
+            max_keepalive_connections: Maximum number of idle connections kept
+                alive for reuse (default: 20)
+            http2: Use HTTP/2 when the server supports it, so concurrent
+                requests are multiplexed over one connection (default: True)
+            cache_size: Maximum number of GET responses kept for conditional
+                requests (If-None-Match); 0 disables the cache (default: 1024)
+            cache_ttl: Seconds a cached GET response is kept (default: 60)
+            cache_max_bytes: Maximum total size of the cached response bodies;
+                larger bodies are not cached (default: 16 MiB)
+            circuit_failure_threshold: Consecutive calls failing with a server
+                error or timeout (after retries) after which requests fail
+                fast with WorkbenchUnavailable (default: 5)
+            circuit_recovery_time: Seconds to fail fast before letting a
+                probe request through (default: 30)
+            max_concurrency: Maximum number of requests in flight at once;
+                further calls wait for a free slot (default: 20)
+            max_concurrent_per_resource: Maximum number of calls in flight
+                through the service request and webhook resources, each
+                counted separately (default: ``max_concurrency``)
+
+        Raises:
+            ValueError: If neither api_key nor access_token is provided
+        """
+        super().__init__(
+            api_key,
+            access_token,
+            base_url,
+            timeout,
+            max_retries,
+            cache_size,
+            cache_ttl,
+            cache_max_bytes,
+            circuit_failure_threshold,
+            circuit_recovery_time,
+        )
+
+        self._max_concurrency = max_concurrency
+        # Created on first use so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # Initialize HTTP client (one shared keep-alive connection pool,
+        # multiplexed over HTTP/2 when the server supports it)
+        self._http = httpx.AsyncClient(
+            **self._http_options(max_connections, max_keepalive_connections, http2)
+        )
+
+        # Initialize resources
+        if max_concurrent_per_resource is None:
+            max_concurrent_per_resource = max_concurrency
+        self.requests = AsyncRequestsResource(self, max_concurrent_per_resource)
+        self.webhooks = AsyncWebhooksResource(self, max_concurrent_per_resource)
+
+    async def warmup(self) -> None:
+        """
+        Open a keep-alive connection to the API ahead of the first request.
+
+        Async version of ``WorkbenchClient.warmup``; await it once after
+        creating the client (e.g. at application startup).
+        """
+        try:
+            await self._http.head("/", timeout=DEFAULT_WARMUP_TIMEOUT)
+        except httpx.HTTPError:
+            pass
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncWorkbenchClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        decode: Optional[Callable[[bytes], Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make an API request.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            path: Request path (without base URL)
+            params: Query parameters
+            json: Request body
+            timeout: Timeout in seconds for this request (default: the
+                client's timeout)
+            decode: Turns the raw response body into the return value
+                (default: JSON decoding into a dictionary)
+
+        Returns:
+            API response as a dictionary (or whatever ``decode`` returns)
+
+        Raises:
+            WorkbenchError: If the request fails
+        """
+        # Filter out None values from params
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        cache_key = self._cache_key(method, path, params)
+        cached = self._cached_response(cache_key)
+        # Serialized once, outside the retry loop
+        content = json_dumps(json) if json is not None else None
+        if decode is None:
+            decode = json_loads
+
+        # The breaker sees each call once, however many attempts it takes
+        self._check_circuit()
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self._max_retries + 1):
+            try:
+                # Only hold a concurrency slot while the request is on the wire
+                async with self._semaphore:
+                    response = await self._http.request(
+                        method=method,
+                        url=path,
+                        params=params,
+                        content=content,
+                        headers=self._conditional_headers(cached),
+                        timeout=self._request_timeout(timeout),
+                    )
+
+                # Unchanged since the cached copy: reuse its body
+                if response.status_code == 304 and cached is not None:
+                    self._record_status(response.status_code)
+                    return self._revalidated(  # type: ignore[no-any-return]
+                        cache_key, cached, decode
+                    )
+
+                # Handle error responses
+                if not response.is_success:
+                    # Check if retryable
+                    if (
+                        self._is_retryable(method, response.status_code)
+                        and attempt < self._max_retries
+                    ):
+                        await asyncio.sleep(self._get_retry_delay(attempt, response))
+                        continue
+
+                    self._record_status(response.status_code)
+                    raise self._error_from_response(response)
+
+                self._record_status(response.status_code)
+
+                # Parse successful response
+                if response.status_code == 204:
+                    return {}
+
+                self._store_response(cache_key, response)
+                return decode(response.content)  # type: ignore[no-any-return]
+
+            except httpx.TimeoutException as e:
+                last_error = WorkbenchError("Request timeout", code="TIMEOUT")
+                if attempt < self._max_retries and is_retryable_error(method, e):
+                    await asyncio.sleep(self._get_retry_delay(attempt))
+                    continue
+                break
+
+            except httpx.RequestError as e:
+                last_error = WorkbenchError(str(e), code="REQUEST_ERROR")
+                if attempt < self._max_retries and is_retryable_error(method, e):
+                    await asyncio.sleep(self._get_retry_delay(attempt))
+                    continue
+                break
+
+        if last_error:
+            self._breaker.record_failure()
+            raise last_error
+
+        raise WorkbenchError("Request failed", code="UNKNOWN_ERROR")
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Make a streaming API request.
+
+        The response body is not read up front: iterate over it inside the
+        ``with`` block. Streaming requests bypass the response cache and are
+        not retried, but they do go through the circuit breaker.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            path: Request path (without base URL)
+            params: Query parameters
+            timeout: Timeout in seconds for this request (default: the
+                client's timeout)
+
+        Yields:
+            The streaming HTTP response
+
+        Raises:
+            WorkbenchError: If the request fails
+        """
+        # Filter out None values from params
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+
+        self._check_circuit()
+        try:
+            async with self._http.stream(
+                method, path, params=params, timeout=self._request_timeout(timeout)
+            ) as response:
+                self._record_status(response.status_code)
+                if not response.is_success:
+                    await response.aread()
+                    raise self._error_from_response(response)
+                yield response
+        except httpx.TimeoutException as e:
+            self._breaker.record_failure()
+            raise WorkbenchError("Request timeout", code="TIMEOUT") from e
+        except httpx.RequestError as e:
+            self._breaker.record_failure()
+            raise WorkbenchError(str(e), code="REQUEST_ERROR") from e
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        decode: Optional[Callable[[bytes], Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make a GET request."""
+        return await self.request("GET", path, params=params, timeout=timeout, decode=decode)
+
+    async def post(
+        self,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Make a POST request."""
+        return await self.request("POST", path, json=json, timeout=timeout)
+
+    async def put(
+        self,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Make a PUT request."""
-        return self.request("PUT", path, json=json)
+        return await self.request("PUT", path, json=json, timeout=timeout)
 
-    def delete(self, path: str) -> Dict[str, Any]:
+    async def delete(self, path: str, timeout: Optional[float] = None) -> Dict[str, Any]:
         """Make a DELETE request."""
-        return self.request("DELETE", path)
+        return await self.request("DELETE", path, timeout=timeout)
@@ -4,18 +4,28 @@ from workbench.resources.clients import ClientsResource
 from workbench.resources.invoices import InvoicesResource
 from workbench.resources.quotes import QuotesResource
 from workbench.resources.jobs import JobsResource
-from workbench.resources.service_requests import ServiceRequestsResource
+from workbench.resources.requests import RequestsResource
 from workbench.resources.webhooks import WebhooksResource
 from workbench.resources.notifications import NotificationsResource
 from workbench.resources.integrations import IntegrationsResource
+from workbench.resources.requests_async import AsyncRequestsResource
+from workbench.resources.webhooks_async import AsyncWebhooksResource
+
+# Alias kept for code that imports the resource by its long name
+ServiceRequestsResource = RequestsResource
+AsyncServiceRequestsResource = AsyncRequestsResource
 
 __all__ = [
     "ClientsResource",
     "InvoicesResource",
     "QuotesResource",
     "JobsResource",
+    "RequestsResource",
     "ServiceRequestsResource",
     "WebhooksResource",
     "NotificationsResource",
     "IntegrationsResource",
+    "AsyncRequestsResource",
+    "AsyncServiceRequestsResource",
+    "AsyncWebhooksResource",
 ]
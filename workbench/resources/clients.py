@@ -4,7 +4,7 @@ Clients resource for the Workbench SDK.
 Provides methods for managing clients in Workbench CRM.
 """
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from workbench.types import (
     Client,
@@ -97,7 +97,7 @@ class ClientsResource:
         status: Optional[ClientStatus] = None,
         source: Optional[str] = None,
         notes: Optional[str] = None,
-        tags: Optional[list[str]] = None,
+        tags: Optional[List[str]] = None,
     ) -> ApiResponse[Client]:
         """
         Create a new client.
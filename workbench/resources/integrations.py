@@ -7,7 +7,7 @@ The IntegrationsResource provides methods for:
 - Managing installed integrations on your business account
 """
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from ..types import (
     ApiResponse,
@@ -211,7 +211,7 @@ class IntegrationsResource:
     def install(
         self,
         integration_id: str,
-        scopes: list[str],
+        scopes: List[str],
         authorization_code: str,
         code_verifier: str,
     ) -> ApiResponse[InstalledIntegration]:
@@ -4,14 +4,23 @@ Requests resource for the Workbench SDK.
 Provides methods for managing service requests in Workbench CRM.
 """
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Literal, Optional, Union, overload
 
+from workbench._bulkhead import DEFAULT_MAX_CONCURRENT, Bulkhead
+from workbench._pagination import DEFAULT_PAGE_SIZE, iter_pages
+from workbench._validation import check_choice
 from workbench.types import (
+    SERVICE_REQUEST_PRIORITIES,
+    SERVICE_REQUEST_STATUSES,
     ServiceRequest,
     ServiceRequestStatus,
     ServiceRequestPriority,
+    CreateServiceRequestParams,
     ApiResponse,
+    BulkResponse,
     ListResponse,
+    LazyListResponse,
+    UnpaginatedListResponse,
 )
 
 if TYPE_CHECKING:
@@ -35,11 +44,121 @@ class RequestsResource:
         ... )
         >>>
         >>> # Update request status
-        >>> client.requests.update(request["data"]["id"], status="scheduled")
+        >>> client.requests.update(request["data"]["id"], status="in_progress")
     """
 
-    def __init__(self, client: "WorkbenchClient"):
+    def __init__(
+        self, client: "WorkbenchClient", max_concurrent: int = DEFAULT_MAX_CONCURRENT
+    ):
+        """
+        Args:
+            client: Client used to make API requests
+            max_concurrent: Maximum number of calls through this resource at
+                once; further calls wait for a free slot (default: 16)
+        """
         self._client = client
+        # Bound once here rather than looked up through the client on every call
+        self._get = client.get
+        self._post = client.post
+        self._put = client.put
+        self._delete = client.delete
+        self._bulkhead = Bulkhead(max_concurrent)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls through this resource currently running."""
+        return self._bulkhead.in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of calls through this resource waiting for a free slot."""
+        return self._bulkhead.queued
+
+    @overload
+    def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        search: Optional[str] = ...,
+        sort: Optional[str] = ...,
+        order: Optional[str] = ...,
+        status: Optional[ServiceRequestStatus] = ...,
+        priority: Optional[ServiceRequestPriority] = ...,
+        client_id: Optional[str] = ...,
+        paginate: Optional[Literal[True]] = ...,
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> ListResponse[ServiceRequest]: ...
+
+    @overload
+    def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        search: Optional[str] = ...,
+        sort: Optional[str] = ...,
+        order: Optional[str] = ...,
+        status: Optional[ServiceRequestStatus] = ...,
+        priority: Optional[ServiceRequestPriority] = ...,
+        client_id: Optional[str] = ...,
+        *,
+        paginate: Literal[False],
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> UnpaginatedListResponse[ServiceRequest]: ...
+
+    @overload
+    def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        search: Optional[str] = ...,
+        sort: Optional[str] = ...,
+        order: Optional[str] = ...,
+        status: Optional[ServiceRequestStatus] = ...,
+        priority: Optional[ServiceRequestPriority] = ...,
+        client_id: Optional[str] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> Union[ListResponse[ServiceRequest], UnpaginatedListResponse[ServiceRequest]]: ...
+
+    @overload
+    def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        search: Optional[str] = ...,
+        sort: Optional[str] = ...,
+        order: Optional[str] = ...,
+        status: Optional[ServiceRequestStatus] = ...,
+        priority: Optional[ServiceRequestPriority] = ...,
+        client_id: Optional[str] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        *,
+        lazy: Literal[True],
+    ) -> LazyListResponse[ServiceRequest]: ...
+
+    @overload
+    def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        search: Optional[str] = ...,
+        sort: Optional[str] = ...,
+        order: Optional[str] = ...,
+        status: Optional[ServiceRequestStatus] = ...,
+        priority: Optional[ServiceRequestPriority] = ...,
+        client_id: Optional[str] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        lazy: bool = ...,
+    ) -> Union[
+        ListResponse[ServiceRequest],
+        UnpaginatedListResponse[ServiceRequest],
+        LazyListResponse[ServiceRequest],
+    ]: ...
 
     def list(
         self,
@@ -51,7 +170,14 @@ class RequestsResource:
         status: Optional[ServiceRequestStatus] = None,
         priority: Optional[ServiceRequestPriority] = None,
         client_id: Optional[str] = None,
-    ) -> ListResponse[ServiceRequest]:
+        paginate: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        lazy: bool = False,
+    ) -> Union[
+        ListResponse[ServiceRequest],
+        UnpaginatedListResponse[ServiceRequest],
+        LazyListResponse[ServiceRequest],
+    ]:
         """
         List all requests.
 
@@ -64,10 +190,22 @@ class RequestsResource:
             status: Filter by status
             priority: Filter by priority
             client_id: Filter by client ID
+            paginate: Set to False to skip pagination metadata. The server
+                then doesn't count the full result set, which makes large
+                listings cheaper when only the next page of items is needed.
+            timeout: Request timeout in seconds (default: the client's timeout)
+            lazy: Return a ``LazyListResponse``, which only decodes the items
+                that are accessed (default: False)
 
         Returns:
-            Paginated list of requests
+            Paginated list of requests (without ``pagination`` if
+            ``paginate`` is False); a ``LazyListResponse`` if ``lazy`` is True
+
+        Raises:
+            ValueError: If ``status`` or ``priority`` is not a known value
         """
+        check_choice("status", status, SERVICE_REQUEST_STATUSES)
+        check_choice("priority", priority, SERVICE_REQUEST_PRIORITIES)
         params: Dict[str, Any] = {
             "page": page,
             "per_page": per_page,
@@ -77,20 +215,77 @@ class RequestsResource:
             "status": status,
             "priority": priority,
             "client_id": client_id,
+            "pagination": "false" if paginate is False else None,
         }
-        return self._client.get("/v1/requests", params=params)  # type: ignore
+        params = {k: v for k, v in params.items() if v is not None}
+        decode = LazyListResponse if lazy else None
+        with self._bulkhead:
+            return self._get(  # type: ignore
+                "/v1/requests", params=params, timeout=timeout, decode=decode
+            )
+
+    def iter_all(
+        self,
+        per_page: int = DEFAULT_PAGE_SIZE,
+        search: Optional[str] = None,
+        sort: Optional[str] = None,
+        order: Optional[str] = None,
+        status: Optional[ServiceRequestStatus] = None,
+        priority: Optional[ServiceRequestPriority] = None,
+        client_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[ServiceRequest]:
+        """
+        Iterate over all requests matching the filters, across every page.
+
+        The next page is fetched in the background while the current one is
+        being consumed.
+
+        Args:
+            per_page: Items per page (1-100, default: 100)
+            search: Search query
+            sort: Field to sort by
+            order: Sort order ("asc" or "desc")
+            status: Filter by status
+            priority: Filter by priority
+            client_id: Filter by client ID
+            timeout: Request timeout in seconds (default: the client's timeout)
 
-    def get(self, id: str) -> ApiResponse[ServiceRequest]:
+        Yields:
+            Requests, in list order
+
+        Raises:
+            ValueError: If ``status`` or ``priority`` is not a known value
+        """
+        check_choice("status", status, SERVICE_REQUEST_STATUSES)
+        check_choice("priority", priority, SERVICE_REQUEST_PRIORITIES)
+        return iter_pages(
+            lambda page: self.list(
+                page=page,
+                per_page=per_page,
+                search=search,
+                sort=sort,
+                order=order,
+                status=status,
+                priority=priority,
+                client_id=client_id,
+                timeout=timeout,
+            )  # type: ignore
+        )
+
+    def get(self, id: str, timeout: Optional[float] = None) -> ApiResponse[ServiceRequest]:
         """
         Get a request by ID.
 
         Args:
             id: Request UUID
+            timeout: Request timeout in seconds (default: the client's timeout)
 
         Returns:
             Request details
         """
-        return self._client.get(f"/v1/requests/{id}")  # type: ignore
+        with self._bulkhead:
+            return self._get(f"/v1/requests/{id}", timeout=timeout)  # type: ignore
 
     def create(
         self,
@@ -107,6 +302,7 @@ class RequestsResource:
         contact_email: Optional[str] = None,
         contact_phone: Optional[str] = None,
         notes: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> ApiResponse[ServiceRequest]:
         """
         Create a new request.
@@ -125,47 +321,151 @@ class RequestsResource:
             contact_email: Contact email
             contact_phone: Contact phone
             notes: Additional notes
+            timeout: Request timeout in seconds (default: the client's timeout)
 
         Returns:
             Created request
+
+        Raises:
+            ValueError: If ``status`` or ``priority`` is not a known value
         """
-        data: Dict[str, Any] = {
-            "title": title,
-            "client_id": client_id,
-            "description": description,
-            "status": status,
-            "source": source,
-            "priority": priority,
-            "requested_date": requested_date,
-            "preferred_time": preferred_time,
-            "address": address,
-            "contact_name": contact_name,
-            "contact_email": contact_email,
-            "contact_phone": contact_phone,
-            "notes": notes,
-        }
-        data = {k: v for k, v in data.items() if v is not None or k == "title"}
-        return self._client.post("/v1/requests", json=data)  # type: ignore
+        check_choice("status", status, SERVICE_REQUEST_STATUSES)
+        check_choice("priority", priority, SERVICE_REQUEST_PRIORITIES)
+        data: Dict[str, Any] = {"title": title}
+        for key, value in (
+            ("client_id", client_id),
+            ("description", description),
+            ("status", status),
+            ("source", source),
+            ("priority", priority),
+            ("requested_date", requested_date),
+            ("preferred_time", preferred_time),
+            ("address", address),
+            ("contact_name", contact_name),
+            ("contact_email", contact_email),
+            ("contact_phone", contact_phone),
+            ("notes", notes),
+        ):
+            if value is not None:
+                data[key] = value
+        with self._bulkhead:
+            return self._post("/v1/requests", json=data, timeout=timeout)  # type: ignore
 
-    def update(self, id: str, **kwargs: Any) -> ApiResponse[ServiceRequest]:
+    def update(
+        self, id: str, *, timeout: Optional[float] = None, **kwargs: Any
+    ) -> ApiResponse[ServiceRequest]:
         """
         Update a request.
 
         Args:
             id: Request UUID
+            timeout: Request timeout in seconds (default: the client's timeout)
             **kwargs: Fields to update
 
         Returns:
             Updated request
+
+        Raises:
+            ValueError: If ``status`` or ``priority`` is not a known value
         """
+        check_choice("status", kwargs.get("status"), SERVICE_REQUEST_STATUSES)
+        check_choice("priority", kwargs.get("priority"), SERVICE_REQUEST_PRIORITIES)
         data = {k: v for k, v in kwargs.items() if v is not None}
-        return self._client.put(f"/v1/requests/{id}", json=data)  # type: ignore
+        with self._bulkhead:
+            return self._put(  # type: ignore
+                f"/v1/requests/{id}", json=data, timeout=timeout
+            )
 
-    def delete(self, id: str) -> None:
+    def delete(self, id: str, timeout: Optional[float] = None) -> None:
         """
         Delete a request.
 
         Args:
             id: Request UUID
+            timeout: Request timeout in seconds (default: the client's timeout)
+        """
+        with self._bulkhead:
+            self._delete(f"/v1/requests/{id}", timeout=timeout)
+
+    def bulk_create(
+        self,
+        items: List[CreateServiceRequestParams],
+        timeout: Optional[float] = None,
+    ) -> BulkResponse[ServiceRequest]:
+        """
+        Create multiple requests in a single API call.
+
+        Items are processed independently: a failing item does not roll back
+        the others. Check each result's ``status`` to find partial failures.
+
+        Args:
+            items: Requests to create (same fields as ``create``)
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            One result per item, in the same order as ``items``
+
+        Raises:
+            ValueError: If an item's ``status`` or ``priority`` is not a known value
+        """
+        for item in items:
+            check_choice("status", item.get("status"), SERVICE_REQUEST_STATUSES)
+            check_choice("priority", item.get("priority"), SERVICE_REQUEST_PRIORITIES)
+        data = {"items": [{k: v for k, v in item.items() if v is not None} for item in items]}
+        with self._bulkhead:
+            return self._post(  # type: ignore
+                "/v1/requests/bulk", json=data, timeout=timeout
+            )
+
+    def bulk_update(
+        self,
+        updates: List[Dict[str, Any]],
+        timeout: Optional[float] = None,
+    ) -> BulkResponse[ServiceRequest]:
+        """
+        Update multiple requests in a single API call.
+
+        Items are processed independently: a failing item does not roll back
+        the others. Check each result's ``status`` to find partial failures.
+
+        Args:
+            updates: Updates to apply; each dict must contain the request ``id``
+                plus the fields to update
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            One result per update, in the same order as ``updates``
+
+        Raises:
+            ValueError: If an update is missing its ``id``, or its ``status`` or ``priority``
+                is not a known value
+        """
+        if any(not update.get("id") for update in updates):
+            raise ValueError("Each update must include an 'id'")
+        for update in updates:
+            check_choice("status", update.get("status"), SERVICE_REQUEST_STATUSES)
+            check_choice("priority", update.get("priority"), SERVICE_REQUEST_PRIORITIES)
+        data = {
+            "items": [{k: v for k, v in update.items() if v is not None} for update in updates]
+        }
+        with self._bulkhead:
+            return self._put("/v1/requests/bulk", json=data, timeout=timeout)  # type: ignore
+
+    def bulk_delete(self, ids: List[str], timeout: Optional[float] = None) -> BulkResponse[None]:
+        """
+        Delete multiple requests in a single API call.
+
+        Items are processed independently: a failing item does not roll back
+        the others. Check each result's ``status`` to find partial failures.
+
+        Args:
+            ids: Request UUIDs
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            One result per ID, in the same order as ``ids``
         """
-        self._client.delete(f"/v1/requests/{id}")
+        with self._bulkhead:
+            return self._post(  # type: ignore
+                "/v1/requests/bulk/delete", json={"ids": ids}, timeout=timeout
+            )
@@ -0,0 +1,482 @@
+"""
+Async requests resource for the Workbench SDK.
+
+Provides async methods for managing service requests in Workbench CRM.
+"""
+
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Literal, Optional, Union, overload
+
+from workbench._bulkhead import DEFAULT_MAX_CONCURRENT, AsyncBulkhead
+from workbench._pagination import DEFAULT_PAGE_SIZE, aiter_pages
+from workbench._validation import check_choice
+from workbench.types import (
+    SERVICE_REQUEST_PRIORITIES,
+    SERVICE_REQUEST_STATUSES,
+    ServiceRequest,
+    ServiceRequestStatus,
+    ServiceRequestPriority,
+    CreateServiceRequestParams,
+    ApiResponse,
+    BulkResponse,
+    ListResponse,
+    LazyListResponse,
+    UnpaginatedListResponse,
+)
+
+if TYPE_CHECKING:
+    from workbench.client import AsyncWorkbenchClient
+
+
+class AsyncRequestsResource:
+    """
+    Async requests resource for managing service requests.
+
+    Mirrors ``RequestsResource`` with awaitable methods, so many calls can run
+    concurrently (e.g. with ``asyncio.gather``).
+
+    Example:
+        >>> client = AsyncWorkbenchClient(api_key="wbk_live_xxx")
+        >>>
+        >>> # Create a service request
+        >>> request = await client.requests.create(
+        ...     title="AC Not Cooling",
+        ...     contact_name="John Doe",
+        ...     contact_email="john@example.com",
+        ...     address="123 Main St",
+        ...     priority="urgent"
+        ... )
+        >>>
+        >>> # Update request status
+        >>> await client.requests.update(request["data"]["id"], status="in_progress")
+    """
+
+    def __init__(
+        self, client: "AsyncWorkbenchClient", max_concurrent: int = DEFAULT_MAX_CONCURRENT
+    ):
+        """
+        Args:
+            client: Client used to make API requests
+            max_concurrent: Maximum number of calls through this resource at
+                once; further calls wait for a free slot (default: 16)
+        """
+        self._client = client
+        # Bound once here rather than looked up through the client on every call
+        self._get = client.get
+        self._post = client.post
+        self._put = client.put
+        self._delete = client.delete
+        self._bulkhead = AsyncBulkhead(max_concurrent)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls through this resource currently running."""
+        return self._bulkhead.in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of calls through this resource waiting for a free slot."""
+        return self._bulkhead.queued
+
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        search: Optional[str] = ...,
+        sort: Optional[str] = ...,
+        order: Optional[str] = ...,
+        status: Optional[ServiceRequestStatus] = ...,
+        priority: Optional[ServiceRequestPriority] = ...,
+        client_id: Optional[str] = ...,
+        paginate: Optional[Literal[True]] = ...,
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> ListResponse[ServiceRequest]: ...
+
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        search: Optional[str] = ...,
+        sort: Optional[str] = ...,
+        order: Optional[str] = ...,
+        status: Optional[ServiceRequestStatus] = ...,
+        priority: Optional[ServiceRequestPriority] = ...,
+        client_id: Optional[str] = ...,
+        *,
+        paginate: Literal[False],
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> UnpaginatedListResponse[ServiceRequest]: ...
+
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        search: Optional[str] = ...,
+        sort: Optional[str] = ...,
+        order: Optional[str] = ...,
+        status: Optional[ServiceRequestStatus] = ...,
+        priority: Optional[ServiceRequestPriority] = ...,
+        client_id: Optional[str] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> Union[ListResponse[ServiceRequest], UnpaginatedListResponse[ServiceRequest]]: ...
+
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        search: Optional[str] = ...,
+        sort: Optional[str] = ...,
+        order: Optional[str] = ...,
+        status: Optional[ServiceRequestStatus] = ...,
+        priority: Optional[ServiceRequestPriority] = ...,
+        client_id: Optional[str] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        *,
+        lazy: Literal[True],
+    ) -> LazyListResponse[ServiceRequest]: ...
+
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        search: Optional[str] = ...,
+        sort: Optional[str] = ...,
+        order: Optional[str] = ...,
+        status: Optional[ServiceRequestStatus] = ...,
+        priority: Optional[ServiceRequestPriority] = ...,
+        client_id: Optional[str] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        lazy: bool = ...,
+    ) -> Union[
+        ListResponse[ServiceRequest],
+        UnpaginatedListResponse[ServiceRequest],
+        LazyListResponse[ServiceRequest],
+    ]: ...
+
+    async def list(
+        self,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        search: Optional[str] = None,
+        sort: Optional[str] = None,
+        order: Optional[str] = None,
+        status: Optional[ServiceRequestStatus] = None,
+        priority: Optional[ServiceRequestPriority] = None,
+        client_id: Optional[str] = None,
+        paginate: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        lazy: bool = False,
+    ) -> Union[
+        ListResponse[ServiceRequest],
+        UnpaginatedListResponse[ServiceRequest],
+        LazyListResponse[ServiceRequest],
+    ]:
+        """
+        List all requests.
+
+        Args:
+            page: Page number (1-indexed, default: 1)
+            per_page: Items per page (1-100, default: 20)
+            search: Search query
+            sort: Field to sort by
+            order: Sort order ("asc" or "desc")
+            status: Filter by status
+            priority: Filter by priority
+            client_id: Filter by client ID
+            paginate: Set to False to skip pagination metadata. The server
+                then doesn't count the full result set, which makes large
+                listings cheaper when only the next page of items is needed.
+            timeout: Request timeout in seconds (default: the client's timeout)
+            lazy: Return a ``LazyListResponse``, which only decodes the items
+                that are accessed (default: False)
+
+        Returns:
+            Paginated list of requests (without ``pagination`` if
+            ``paginate`` is False); a ``LazyListResponse`` if ``lazy`` is True
+
+        Raises:
+            ValueError: If ``status`` or ``priority`` is not a known value
+        """
+        check_choice("status", status, SERVICE_REQUEST_STATUSES)
+        check_choice("priority", priority, SERVICE_REQUEST_PRIORITIES)
+        params: Dict[str, Any] = {
+            "page": page,
+            "per_page": per_page,
+            "search": search,
+            "sort": sort,
+            "order": order,
+            "status": status,
+            "priority": priority,
+            "client_id": client_id,
+            "pagination": "false" if paginate is False else None,
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        decode = LazyListResponse if lazy else None
+        async with self._bulkhead:
+            return await self._get(  # type: ignore
+                "/v1/requests", params=params, timeout=timeout, decode=decode
+            )
+
+    def iter_all(
+        self,
+        per_page: int = DEFAULT_PAGE_SIZE,
+        search: Optional[str] = None,
+        sort: Optional[str] = None,
+        order: Optional[str] = None,
+        status: Optional[ServiceRequestStatus] = None,
+        priority: Optional[ServiceRequestPriority] = None,
+        client_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[ServiceRequest]:
+        """
+        Iterate over all requests matching the filters, across every page.
+
+        The next page is fetched in the background while the current one is
+        being consumed.
+
+        Args:
+            per_page: Items per page (1-100, default: 100)
+            search: Search query
+            sort: Field to sort by
+            order: Sort order ("asc" or "desc")
+            status: Filter by status
+            priority: Filter by priority
+            client_id: Filter by client ID
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Yields:
+            Requests, in list order (use with ``async for``)
+
+        Raises:
+            ValueError: If ``status`` or ``priority`` is not a known value
+        """
+        check_choice("status", status, SERVICE_REQUEST_STATUSES)
+        check_choice("priority", priority, SERVICE_REQUEST_PRIORITIES)
+        return aiter_pages(
+            lambda page: self.list(
+                page=page,
+                per_page=per_page,
+                search=search,
+                sort=sort,
+                order=order,
+                status=status,
+                priority=priority,
+                client_id=client_id,
+                timeout=timeout,
+            )  # type: ignore
+        )
+
+    async def get(self, id: str, timeout: Optional[float] = None) -> ApiResponse[ServiceRequest]:
+        """
+        Get a request by ID.
+
+        Args:
+            id: Request UUID
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            Request details
+        """
+        async with self._bulkhead:
+            return await self._get(f"/v1/requests/{id}", timeout=timeout)  # type: ignore
+
+    async def create(
+        self,
+        title: str,
+        client_id: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[ServiceRequestStatus] = None,
+        source: Optional[str] = None,
+        priority: Optional[ServiceRequestPriority] = None,
+        requested_date: Optional[str] = None,
+        preferred_time: Optional[str] = None,
+        address: Optional[str] = None,
+        contact_name: Optional[str] = None,
+        contact_email: Optional[str] = None,
+        contact_phone: Optional[str] = None,
+        notes: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> ApiResponse[ServiceRequest]:
+        """
+        Create a new request.
+
+        Args:
+            title: Request title (required)
+            client_id: Client UUID
+            description: Request description
+            status: Request status
+            source: Request source
+            priority: Request priority
+            requested_date: Requested service date
+            preferred_time: Preferred time slot
+            address: Service address
+            contact_name: Contact name
+            contact_email: Contact email
+            contact_phone: Contact phone
+            notes: Additional notes
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            Created request
+
+        Raises:
+            ValueError: If ``status`` or ``priority`` is not a known value
+        """
+        check_choice("status", status, SERVICE_REQUEST_STATUSES)
+        check_choice("priority", priority, SERVICE_REQUEST_PRIORITIES)
+        data: Dict[str, Any] = {"title": title}
+        for key, value in (
+            ("client_id", client_id),
+            ("description", description),
+            ("status", status),
+            ("source", source),
+            ("priority", priority),
+            ("requested_date", requested_date),
+            ("preferred_time", preferred_time),
+            ("address", address),
+            ("contact_name", contact_name),
+            ("contact_email", contact_email),
+            ("contact_phone", contact_phone),
+            ("notes", notes),
+        ):
+            if value is not None:
+                data[key] = value
+        async with self._bulkhead:
+            return await self._post(  # type: ignore
+                "/v1/requests", json=data, timeout=timeout
+            )
+
+    async def update(
+        self, id: str, *, timeout: Optional[float] = None, **kwargs: Any
+    ) -> ApiResponse[ServiceRequest]:
+        """
+        Update a request.
+
+        Args:
+            id: Request UUID
+            timeout: Request timeout in seconds (default: the client's timeout)
+            **kwargs: Fields to update
+
+        Returns:
+            Updated request
+
+        Raises:
+            ValueError: If ``status`` or ``priority`` is not a known value
+        """
+        check_choice("status", kwargs.get("status"), SERVICE_REQUEST_STATUSES)
+        check_choice("priority", kwargs.get("priority"), SERVICE_REQUEST_PRIORITIES)
+        data = {k: v for k, v in kwargs.items() if v is not None}
+        async with self._bulkhead:
+            return await self._put(  # type: ignore
+                f"/v1/requests/{id}", json=data, timeout=timeout
+            )
+
+    async def delete(self, id: str, timeout: Optional[float] = None) -> None:
+        """
+        Delete a request.
+
+        Args:
+            id: Request UUID
+            timeout: Request timeout in seconds (default: the client's timeout)
+        """
+        async with self._bulkhead:
+            await self._delete(f"/v1/requests/{id}", timeout=timeout)
+
+    async def bulk_create(
+        self,
+        items: List[CreateServiceRequestParams],
+        timeout: Optional[float] = None,
+    ) -> BulkResponse[ServiceRequest]:
+        """
+        Create multiple requests in a single API call.
+
+        Items are processed independently: a failing item does not roll back
+        the others. Check each result's ``status`` to find partial failures.
+
+        Args:
+            items: Requests to create (same fields as ``create``)
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            One result per item, in the same order as ``items``
+
+        Raises:
+            ValueError: If an item's ``status`` or ``priority`` is not a known value
+        """
+        for item in items:
+            check_choice("status", item.get("status"), SERVICE_REQUEST_STATUSES)
+            check_choice("priority", item.get("priority"), SERVICE_REQUEST_PRIORITIES)
+        data = {"items": [{k: v for k, v in item.items() if v is not None} for item in items]}
+        async with self._bulkhead:
+            return await self._post(  # type: ignore
+                "/v1/requests/bulk", json=data, timeout=timeout
+            )
+
+    async def bulk_update(
+        self,
+        updates: List[Dict[str, Any]],
+        timeout: Optional[float] = None,
+    ) -> BulkResponse[ServiceRequest]:
+        """
+        Update multiple requests in a single API call.
+
+        Items are processed independently: a failing item does not roll back
+        the others. Check each result's ``status`` to find partial failures.
+
+        Args:
+            updates: Updates to apply; each dict must contain the request ``id``
+                plus the fields to update
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            One result per update, in the same order as ``updates``
+
+        Raises:
+            ValueError: If an update is missing its ``id``, or its ``status`` or ``priority``
+                is not a known value
+        """
+        if any(not update.get("id") for update in updates):
+            raise ValueError("Each update must include an 'id'")
+        for update in updates:
+            check_choice("status", update.get("status"), SERVICE_REQUEST_STATUSES)
+            check_choice("priority", update.get("priority"), SERVICE_REQUEST_PRIORITIES)
+        data = {
+            "items": [{k: v for k, v in update.items() if v is not None} for update in updates]
+        }
+        async with self._bulkhead:
+            return await self._put(  # type: ignore
+                "/v1/requests/bulk", json=data, timeout=timeout
+            )
+
+    async def bulk_delete(
+        self,
+        ids: List[str],
+        timeout: Optional[float] = None,
+    ) -> BulkResponse[None]:
+        """
+        Delete multiple requests in a single API call.
+
+        Items are processed independently: a failing item does not roll back
+        the others. Check each result's ``status`` to find partial failures.
+
+        Args:
+            ids: Request UUIDs
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            One result per ID, in the same order as ``ids``
+        """
+        async with self._bulkhead:
+            return await self._post(  # type: ignore
+                "/v1/requests/bulk/delete", json={"ids": ids}, timeout=timeout
+            )
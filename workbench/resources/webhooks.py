@@ -4,16 +4,28 @@ Webhooks resource for the Workbench SDK.
 Provides methods for managing webhook subscriptions in Workbench CRM.
 """
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Literal, Optional, Union, overload
 
+from workbench._bulkhead import DEFAULT_MAX_CONCURRENT, Bulkhead
+from workbench._json import iter_array_items
+from workbench._pagination import DEFAULT_PAGE_SIZE, iter_pages
+from workbench._validation import check_choice, check_choices
 from workbench.types import (
+    WEBHOOK_DELIVERY_STATUSES,
+    WEBHOOK_EVENTS,
     Webhook,
     WebhookDelivery,
+    WebhookDeliveryStatus,
     WebhookEvent,
     WebhookSecretResponse,
     WebhookEventTypeInfo,
+    CreateWebhookParams,
     ApiResponse,
+    BulkResponse,
     ListResponse,
+    LazyListResponse,
+    UnpaginatedListResponse,
 )
 
 if TYPE_CHECKING:
@@ -38,41 +50,165 @@ class WebhooksResource:
         >>> print(f"Webhook secret: {webhook['data']['secret']}")
     """
 
-    def __init__(self, client: "WorkbenchClient"):
+    def __init__(
+        self, client: "WorkbenchClient", max_concurrent: int = DEFAULT_MAX_CONCURRENT
+    ):
+        """
+        Args:
+            client: Client used to make API requests
+            max_concurrent: Maximum number of calls through this resource at
+                once; further calls wait for a free slot (default: 16)
+        """
         self._client = client
+        # Bound once here rather than looked up through the client on every call
+        self._get = client.get
+        self._post = client.post
+        self._put = client.put
+        self._delete = client.delete
+        self._bulkhead = Bulkhead(max_concurrent)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls through this resource currently running."""
+        return self._bulkhead.in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of calls through this resource waiting for a free slot."""
+        return self._bulkhead.queued
+
+    @overload
+    def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        paginate: Optional[Literal[True]] = ...,
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> ListResponse[Webhook]: ...
+
+    @overload
+    def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        *,
+        paginate: Literal[False],
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> UnpaginatedListResponse[Webhook]: ...
+
+    @overload
+    def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> Union[ListResponse[Webhook], UnpaginatedListResponse[Webhook]]: ...
+
+    @overload
+    def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        *,
+        lazy: Literal[True],
+    ) -> LazyListResponse[Webhook]: ...
+
+    @overload
+    def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        lazy: bool = ...,
+    ) -> Union[
+        ListResponse[Webhook],
+        UnpaginatedListResponse[Webhook],
+        LazyListResponse[Webhook],
+    ]: ...
 
     def list(
         self,
         page: Optional[int] = None,
         per_page: Optional[int] = None,
-    ) -> ListResponse[Webhook]:
+        paginate: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        lazy: bool = False,
+    ) -> Union[
+        ListResponse[Webhook],
+        UnpaginatedListResponse[Webhook],
+        LazyListResponse[Webhook],
+    ]:
         """
         List all webhooks.
 
         Args:
             page: Page number (1-indexed, default: 1)
             per_page: Items per page (1-100, default: 20)
+            paginate: Set to False to skip pagination metadata. The server
+                then doesn't count the full result set, which makes large
+                listings cheaper when only the next page of items is needed.
+            timeout: Request timeout in seconds (default: the client's timeout)
+            lazy: Return a ``LazyListResponse``, which only decodes the items
+                that are accessed (default: False)
 
         Returns:
-            Paginated list of webhooks
+            Paginated list of webhooks (without ``pagination`` if
+            ``paginate`` is False); a ``LazyListResponse`` if ``lazy`` is True
         """
         params: Dict[str, Any] = {
             "page": page,
             "per_page": per_page,
+            "pagination": "false" if paginate is False else None,
         }
-        return self._client.get("/v1/webhooks", params=params)  # type: ignore
+        params = {k: v for k, v in params.items() if v is not None}
+        decode = LazyListResponse if lazy else None
+        with self._bulkhead:
+            return self._get(  # type: ignore
+                "/v1/webhooks", params=params, timeout=timeout, decode=decode
+            )
+
+    def iter_all(
+        self,
+        per_page: int = DEFAULT_PAGE_SIZE,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Webhook]:
+        """
+        Iterate over all webhooks, across every page.
 
-    def get(self, id: str) -> ApiResponse[Webhook]:
+        The next page is fetched in the background while the current one is
+        being consumed.
+
+        Args:
+            per_page: Items per page (1-100, default: 100)
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Yields:
+            Webhooks, in list order
+        """
+        return iter_pages(
+            lambda page: self.list(page=page, per_page=per_page, timeout=timeout)  # type: ignore
+        )
+
+    def get(self, id: str, timeout: Optional[float] = None) -> ApiResponse[Webhook]:
         """
         Get a webhook by ID.
 
         Args:
             id: Webhook UUID
+            timeout: Request timeout in seconds (default: the client's timeout)
 
         Returns:
             Webhook details
         """
-        return self._client.get(f"/v1/webhooks/{id}")  # type: ignore
+        with self._bulkhead:
+            return self._get(f"/v1/webhooks/{id}", timeout=timeout)  # type: ignore
 
     def create(
         self,
@@ -80,6 +216,7 @@ class WebhooksResource:
         url: str,
         events: List[WebhookEvent],
         metadata: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
     ) -> ApiResponse[Webhook]:
         """
         Create a new webhook.
@@ -92,10 +229,15 @@ class WebhooksResource:
             url: Webhook endpoint URL
             events: List of events to subscribe to
             metadata: Optional custom metadata to attach to the webhook
+            timeout: Request timeout in seconds (default: the client's timeout)
 
         Returns:
             Created webhook (includes secret)
+
+        Raises:
+            ValueError: If an event is not a known webhook event
         """
+        check_choices("event", events, WEBHOOK_EVENTS)
         data: Dict[str, Any] = {
             "name": name,
             "url": url,
@@ -103,7 +245,8 @@ class WebhooksResource:
         }
         if metadata is not None:
             data["metadata"] = metadata
-        return self._client.post("/v1/webhooks", json=data)  # type: ignore
+        with self._bulkhead:
+            return self._post("/v1/webhooks", json=data, timeout=timeout)  # type: ignore
 
     def update(
         self,
@@ -113,6 +256,7 @@ class WebhooksResource:
         events: Optional[List[WebhookEvent]] = None,
         is_active: Optional[bool] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
     ) -> ApiResponse[Webhook]:
         """
         Update a webhook.
@@ -124,28 +268,111 @@ class WebhooksResource:
             events: New list of events
             is_active: Whether the webhook is active
             metadata: Custom metadata to attach to the webhook
+            timeout: Request timeout in seconds (default: the client's timeout)
 
         Returns:
             Updated webhook
-        """
-        data: Dict[str, Any] = {
-            "name": name,
-            "url": url,
-            "events": events,
-            "is_active": is_active,
-            "metadata": metadata,
-        }
-        data = {k: v for k, v in data.items() if v is not None}
-        return self._client.put(f"/v1/webhooks/{id}", json=data)  # type: ignore
 
-    def delete(self, id: str) -> None:
+        Raises:
+            ValueError: If an event is not a known webhook event
+        """
+        check_choices("event", events, WEBHOOK_EVENTS)
+        data: Dict[str, Any] = {}
+        for key, value in (
+            ("name", name),
+            ("url", url),
+            ("events", events),
+            ("is_active", is_active),
+            ("metadata", metadata),
+        ):
+            if value is not None:
+                data[key] = value
+        with self._bulkhead:
+            return self._put(  # type: ignore
+                f"/v1/webhooks/{id}", json=data, timeout=timeout
+            )
+
+    def delete(self, id: str, timeout: Optional[float] = None) -> None:
         """
         Delete a webhook.
 
         Args:
             id: Webhook UUID
+            timeout: Request timeout in seconds (default: the client's timeout)
         """
-        self._client.delete(f"/v1/webhooks/{id}")
+        with self._bulkhead:
+            self._delete(f"/v1/webhooks/{id}", timeout=timeout)
+
+    @overload
+    def list_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        event_type: Optional[WebhookEvent] = ...,
+        status: Optional[WebhookDeliveryStatus] = ...,
+        paginate: Optional[Literal[True]] = ...,
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> ListResponse[WebhookDelivery]: ...
+
+    @overload
+    def list_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        event_type: Optional[WebhookEvent] = ...,
+        status: Optional[WebhookDeliveryStatus] = ...,
+        *,
+        paginate: Literal[False],
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> UnpaginatedListResponse[WebhookDelivery]: ...
+
+    @overload
+    def list_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        event_type: Optional[WebhookEvent] = ...,
+        status: Optional[WebhookDeliveryStatus] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> Union[ListResponse[WebhookDelivery], UnpaginatedListResponse[WebhookDelivery]]: ...
+
+    @overload
+    def list_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        event_type: Optional[WebhookEvent] = ...,
+        status: Optional[WebhookDeliveryStatus] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        *,
+        lazy: Literal[True],
+    ) -> LazyListResponse[WebhookDelivery]: ...
+
+    @overload
+    def list_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        event_type: Optional[WebhookEvent] = ...,
+        status: Optional[WebhookDeliveryStatus] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        lazy: bool = ...,
+    ) -> Union[
+        ListResponse[WebhookDelivery],
+        UnpaginatedListResponse[WebhookDelivery],
+        LazyListResponse[WebhookDelivery],
+    ]: ...
 
     def list_deliveries(
         self,
@@ -153,7 +380,15 @@ class WebhooksResource:
         page: Optional[int] = None,
         per_page: Optional[int] = None,
         event_type: Optional[WebhookEvent] = None,
-    ) -> ListResponse[WebhookDelivery]:
+        status: Optional[WebhookDeliveryStatus] = None,
+        paginate: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        lazy: bool = False,
+    ) -> Union[
+        ListResponse[WebhookDelivery],
+        UnpaginatedListResponse[WebhookDelivery],
+        LazyListResponse[WebhookDelivery],
+    ]:
         """
         List webhook deliveries.
 
@@ -162,21 +397,220 @@ class WebhooksResource:
             page: Page number (1-indexed, default: 1)
             per_page: Items per page (1-100, default: 20)
             event_type: Filter by event type
+            status: Filter by delivery status ("pending", "delivered" or "failed")
+            paginate: Set to False to skip pagination metadata. The server
+                then doesn't count the full result set, which makes large
+                listings cheaper when only the next page of items is needed.
+            timeout: Request timeout in seconds (default: the client's timeout)
+            lazy: Return a ``LazyListResponse``, which only decodes the items
+                that are accessed (default: False)
 
         Returns:
-            Paginated list of delivery attempts
+            Paginated list of delivery attempts (without ``pagination`` if
+            ``paginate`` is False); a ``LazyListResponse`` if ``lazy`` is True
+
+        Raises:
+            ValueError: If ``event_type`` or ``status`` is not a known value
+        """
+        check_choice("event_type", event_type, WEBHOOK_EVENTS)
+        check_choice("status", status, WEBHOOK_DELIVERY_STATUSES)
+        params: Dict[str, Any] = {
+            "page": page,
+            "per_page": per_page,
+            "event_type": event_type,
+            "status": status,
+            "pagination": "false" if paginate is False else None,
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        decode = LazyListResponse if lazy else None
+        with self._bulkhead:
+            return self._get(  # type: ignore
+                f"/v1/webhooks/{webhook_id}/deliveries",
+                params=params,
+                timeout=timeout,
+                decode=decode,
+            )
+
+    @overload
+    def list_failed_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        event_type: Optional[WebhookEvent] = ...,
+        paginate: Optional[Literal[True]] = ...,
+        timeout: Optional[float] = ...,
+    ) -> ListResponse[WebhookDelivery]: ...
+
+    @overload
+    def list_failed_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        event_type: Optional[WebhookEvent] = ...,
+        *,
+        paginate: Literal[False],
+        timeout: Optional[float] = ...,
+    ) -> UnpaginatedListResponse[WebhookDelivery]: ...
+
+    @overload
+    def list_failed_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        event_type: Optional[WebhookEvent] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+    ) -> Union[ListResponse[WebhookDelivery], UnpaginatedListResponse[WebhookDelivery]]: ...
+
+    def list_failed_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        event_type: Optional[WebhookEvent] = None,
+        paginate: Optional[bool] = None,
+        timeout: Optional[float] = None,
+    ) -> Union[ListResponse[WebhookDelivery], UnpaginatedListResponse[WebhookDelivery]]:
+        """
+        List deliveries that failed permanently.
+
+        Together with ``replay_delivery`` this works as a dead-letter queue:
+        after an outage on the receiving end, list what failed and replay it
+        instead of re-creating the events.
+
+        Args:
+            webhook_id: Webhook UUID
+            page: Page number (1-indexed, default: 1)
+            per_page: Items per page (1-100, default: 20)
+            event_type: Filter by event type
+            paginate: Set to False to skip pagination metadata
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            Paginated list of failed delivery attempts
+
+        Raises:
+            ValueError: If ``event_type`` is not a known webhook event
+        """
+        return self.list_deliveries(
+            webhook_id,
+            page=page,
+            per_page=per_page,
+            event_type=event_type,
+            status="failed",
+            paginate=paginate,
+            timeout=timeout,
+        )
+
+    def list_deliveries_iter(
+        self,
+        webhook_id: str,
+        per_page: int = DEFAULT_PAGE_SIZE,
+        event_type: Optional[WebhookEvent] = None,
+        status: Optional[WebhookDeliveryStatus] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[WebhookDelivery]:
         """
+        Iterate over all deliveries of a webhook, across every page.
+
+        Useful for auditing a webhook's full delivery history. The next page
+        is fetched in the background while the current one is being consumed.
+
+        Args:
+            webhook_id: Webhook UUID
+            per_page: Items per page (1-100, default: 100)
+            event_type: Filter by event type
+            status: Filter by delivery status ("pending", "delivered" or "failed")
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Yields:
+            Delivery attempts, in list order
+
+        Raises:
+            ValueError: If ``event_type`` or ``status`` is not a known value
+        """
+        check_choice("event_type", event_type, WEBHOOK_EVENTS)
+        check_choice("status", status, WEBHOOK_DELIVERY_STATUSES)
+        return iter_pages(
+            lambda page: self.list_deliveries(
+                webhook_id,
+                page=page,
+                per_page=per_page,
+                event_type=event_type,
+                status=status,
+                timeout=timeout,
+            )  # type: ignore
+        )
+
+    def stream_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        event_type: Optional[WebhookEvent] = None,
+        status: Optional[WebhookDeliveryStatus] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[WebhookDelivery]:
+        """
+        Stream one page of webhook deliveries.
+
+        Unlike ``list_deliveries``, the response is parsed as it arrives and
+        each delivery is yielded as soon as it has been read, so large pages
+        never have to be held in memory at once. Requires ijson
+        (``pip install workbench-sdk[speedups]``) for incremental parsing;
+        without it the page is read in full before the first delivery is
+        yielded. Streamed requests are not retried.
+
+        A concurrency slot is only held while the request is being sent, so
+        it is safe to make other calls through this resource while iterating.
+
+        Args:
+            webhook_id: Webhook UUID
+            page: Page number (1-indexed, default: 1)
+            per_page: Items per page (1-100, default: 20)
+            event_type: Filter by event type
+            status: Filter by delivery status ("pending", "delivered" or "failed")
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Yields:
+            Delivery attempts, in list order
+
+        Raises:
+            ValueError: If ``event_type`` or ``status`` is not a known value
+        """
+        check_choice("event_type", event_type, WEBHOOK_EVENTS)
+        check_choice("status", status, WEBHOOK_DELIVERY_STATUSES)
         params: Dict[str, Any] = {
             "page": page,
             "per_page": per_page,
             "event_type": event_type,
+            "status": status,
         }
-        return self._client.get(f"/v1/webhooks/{webhook_id}/deliveries", params=params)  # type: ignore
+        return self._stream_deliveries(webhook_id, params, timeout)
+
+    def _stream_deliveries(
+        self, webhook_id: str, params: Dict[str, Any], timeout: Optional[float]
+    ) -> Iterator[WebhookDelivery]:
+        with ExitStack() as stack:
+            with self._bulkhead:
+                response = stack.enter_context(
+                    self._client.stream(
+                        "GET",
+                        f"/v1/webhooks/{webhook_id}/deliveries",
+                        params=params,
+                        timeout=timeout,
+                    )
+                )
+            yield from iter_array_items(response.iter_bytes(), "data")
 
     def get_delivery(
         self,
         webhook_id: str,
         delivery_id: str,
+        timeout: Optional[float] = None,
     ) -> ApiResponse[WebhookDelivery]:
         """
         Get a single webhook delivery.
@@ -187,25 +621,60 @@ class WebhooksResource:
         Args:
             webhook_id: Webhook UUID
             delivery_id: Delivery UUID
+            timeout: Request timeout in seconds (default: the client's timeout)
 
         Returns:
             Delivery details
         """
-        return self._client.get(f"/v1/webhooks/{webhook_id}/deliveries/{delivery_id}")  # type: ignore
+        with self._bulkhead:
+            return self._get(  # type: ignore
+                f"/v1/webhooks/{webhook_id}/deliveries/{delivery_id}", timeout=timeout
+            )
+
+    def replay_delivery(
+        self,
+        webhook_id: str,
+        delivery_id: str,
+        timeout: Optional[float] = None,
+    ) -> ApiResponse[WebhookDelivery]:
+        """
+        Replay a webhook delivery.
+
+        Sends the original event payload to the webhook URL again, as a new
+        delivery attempt.
+
+        Args:
+            webhook_id: Webhook UUID
+            delivery_id: UUID of the delivery to replay
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            The new delivery attempt
+        """
+        with self._bulkhead:
+            return self._post(  # type: ignore
+                f"/v1/webhooks/{webhook_id}/deliveries/{delivery_id}/replay", timeout=timeout
+            )
 
-    def test(self, id: str) -> ApiResponse[Dict[str, str]]:
+    def test(self, id: str, timeout: Optional[float] = None) -> ApiResponse[Dict[str, str]]:
         """
         Send a test webhook.
 
         Args:
             id: Webhook UUID
+            timeout: Request timeout in seconds (default: the client's timeout)
 
         Returns:
             Test delivery result with message and delivery_id
         """
-        return self._client.post(f"/v1/webhooks/{id}/test")  # type: ignore
+        with self._bulkhead:
+            return self._post(f"/v1/webhooks/{id}/test", timeout=timeout)  # type: ignore
 
-    def regenerate_secret(self, id: str) -> ApiResponse[WebhookSecretResponse]:
+    def regenerate_secret(
+        self,
+        id: str,
+        timeout: Optional[float] = None,
+    ) -> ApiResponse[WebhookSecretResponse]:
         """
         Regenerate webhook secret.
 
@@ -215,20 +684,112 @@ class WebhooksResource:
 
         Args:
             id: Webhook UUID
+            timeout: Request timeout in seconds (default: the client's timeout)
 
         Returns:
             New webhook secret
         """
-        return self._client.post(f"/v1/webhooks/{id}/secret")  # type: ignore
+        with self._bulkhead:
+            return self._post(f"/v1/webhooks/{id}/secret", timeout=timeout)  # type: ignore
 
-    def list_event_types(self) -> ApiResponse[List[WebhookEventTypeInfo]]:
+    def list_event_types(
+        self,
+        timeout: Optional[float] = None,
+    ) -> ApiResponse[List[WebhookEventTypeInfo]]:
         """
         List available webhook event types.
 
         Returns all event types that can be subscribed to, with
         descriptions and categories.
 
+        Args:
+            timeout: Request timeout in seconds (default: the client's timeout)
+
         Returns:
             List of available event types with descriptions
         """
-        return self._client.get("/v1/webhooks/event-types")  # type: ignore
+        with self._bulkhead:
+            return self._get("/v1/webhooks/event-types", timeout=timeout)  # type: ignore
+
+    def bulk_create(
+        self,
+        items: List[CreateWebhookParams],
+        timeout: Optional[float] = None,
+    ) -> BulkResponse[Webhook]:
+        """
+        Create multiple webhooks in a single API call.
+
+        Items are processed independently: a failing item does not roll back
+        the others. Check each result's ``status`` to find partial failures.
+        Each successful result includes the new webhook's secret - store it
+        securely.
+
+        Args:
+            items: Webhooks to create (same fields as ``create``)
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            One result per item, in the same order as ``items``
+
+        Raises:
+            ValueError: If an event is not a known webhook event
+        """
+        for item in items:
+            check_choices("event", item.get("events"), WEBHOOK_EVENTS)
+        data = {"items": [{k: v for k, v in item.items() if v is not None} for item in items]}
+        with self._bulkhead:
+            return self._post(  # type: ignore
+                "/v1/webhooks/bulk", json=data, timeout=timeout
+            )
+
+    def bulk_update(
+        self,
+        updates: List[Dict[str, Any]],
+        timeout: Optional[float] = None,
+    ) -> BulkResponse[Webhook]:
+        """
+        Update multiple webhooks in a single API call.
+
+        Items are processed independently: a failing item does not roll back
+        the others. Check each result's ``status`` to find partial failures.
+
+        Args:
+            updates: Updates to apply; each dict must contain the webhook ``id``
+                plus the fields to update
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            One result per update, in the same order as ``updates``
+
+        Raises:
+            ValueError: If an update is missing its ``id``, or an event is not a
+                known webhook event
+        """
+        if any(not update.get("id") for update in updates):
+            raise ValueError("Each update must include an 'id'")
+        for update in updates:
+            check_choices("event", update.get("events"), WEBHOOK_EVENTS)
+        data = {
+            "items": [{k: v for k, v in update.items() if v is not None} for update in updates]
+        }
+        with self._bulkhead:
+            return self._put("/v1/webhooks/bulk", json=data, timeout=timeout)  # type: ignore
+
+    def bulk_delete(self, ids: List[str], timeout: Optional[float] = None) -> BulkResponse[None]:
+        """
+        Delete multiple webhooks in a single API call.
+
+        Items are processed independently: a failing item does not roll back
+        the others. Check each result's ``status`` to find partial failures.
+
+        Args:
+            ids: Webhook UUIDs
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            One result per ID, in the same order as ``ids``
+        """
+        with self._bulkhead:
+            return self._post(  # type: ignore
+                "/v1/webhooks/bulk/delete", json={"ids": ids}, timeout=timeout
+            )
@@ -0,0 +1,890 @@
+"""
+Async webhooks resource for the Workbench SDK.
+
+Provides async methods for managing webhook subscriptions in Workbench CRM.
+"""
+
+import asyncio
+from collections import defaultdict
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Literal, Optional, Union, overload
+
+from workbench._bulkhead import DEFAULT_MAX_CONCURRENT, AsyncBulkhead
+from workbench._json import aiter_array_items
+from workbench._pagination import DEFAULT_PAGE_SIZE, aiter_pages
+from workbench._validation import check_choice, check_choices
+from workbench.types import (
+    WEBHOOK_DELIVERY_STATUSES,
+    WEBHOOK_EVENTS,
+    Webhook,
+    WebhookDelivery,
+    WebhookDeliveryStatus,
+    WebhookEvent,
+    WebhookSecretResponse,
+    WebhookEventTypeInfo,
+    CreateWebhookParams,
+    ApiResponse,
+    BulkResponse,
+    ListResponse,
+    LazyListResponse,
+    UnpaginatedListResponse,
+)
+
+if TYPE_CHECKING:
+    from workbench.client import AsyncWorkbenchClient, WorkbenchError
+
+DEFAULT_REPLAY_TIMEOUT = 10.0
+DEFAULT_REPLAY_MAX_TOTAL = 32
+
+
+class AsyncWebhooksResource:
+    """
+    Async webhooks resource.
+
+    Mirrors ``WebhooksResource`` with awaitable methods, so many calls can run
+    concurrently (e.g. with ``asyncio.gather``).
+
+    Example:
+        >>> client = AsyncWorkbenchClient(api_key="wbk_live_xxx")
+        >>>
+        >>> # Create a webhook
+        >>> webhook = await client.webhooks.create(
+        ...     name="Invoice Notifications",
+        ...     url="https://example.com/webhooks/workbench",
+        ...     events=["invoice.created", "invoice.paid"]
+        ... )
+        >>>
+        >>> # Store the secret securely!
+        >>> print(f"Webhook secret: {webhook['data']['secret']}")
+    """
+
+    def __init__(
+        self, client: "AsyncWorkbenchClient", max_concurrent: int = DEFAULT_MAX_CONCURRENT
+    ):
+        """
+        Args:
+            client: Client used to make API requests
+            max_concurrent: Maximum number of calls through this resource at
+                once; further calls wait for a free slot (default: 16)
+        """
+        self._client = client
+        # Bound once here rather than looked up through the client on every call
+        self._get = client.get
+        self._post = client.post
+        self._put = client.put
+        self._delete = client.delete
+        self._bulkhead = AsyncBulkhead(max_concurrent)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls through this resource currently running."""
+        return self._bulkhead.in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of calls through this resource waiting for a free slot."""
+        return self._bulkhead.queued
+
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        paginate: Optional[Literal[True]] = ...,
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> ListResponse[Webhook]: ...
+
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        *,
+        paginate: Literal[False],
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> UnpaginatedListResponse[Webhook]: ...
+
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> Union[ListResponse[Webhook], UnpaginatedListResponse[Webhook]]: ...
+
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        *,
+        lazy: Literal[True],
+    ) -> LazyListResponse[Webhook]: ...
+
+    @overload
+    async def list(
+        self,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        lazy: bool = ...,
+    ) -> Union[
+        ListResponse[Webhook],
+        UnpaginatedListResponse[Webhook],
+        LazyListResponse[Webhook],
+    ]: ...
+
+    async def list(
+        self,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        paginate: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        lazy: bool = False,
+    ) -> Union[
+        ListResponse[Webhook],
+        UnpaginatedListResponse[Webhook],
+        LazyListResponse[Webhook],
+    ]:
+        """
+        List all webhooks.
+
+        Args:
+            page: Page number (1-indexed, default: 1)
+            per_page: Items per page (1-100, default: 20)
+            paginate: Set to False to skip pagination metadata. The server
+                then doesn't count the full result set, which makes large
+                listings cheaper when only the next page of items is needed.
+            timeout: Request timeout in seconds (default: the client's timeout)
+            lazy: Return a ``LazyListResponse``, which only decodes the items
+                that are accessed (default: False)
+
+        Returns:
+            Paginated list of webhooks (without ``pagination`` if
+            ``paginate`` is False); a ``LazyListResponse`` if ``lazy`` is True
+        """
+        params: Dict[str, Any] = {
+            "page": page,
+            "per_page": per_page,
+            "pagination": "false" if paginate is False else None,
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        decode = LazyListResponse if lazy else None
+        async with self._bulkhead:
+            return await self._get(  # type: ignore
+                "/v1/webhooks", params=params, timeout=timeout, decode=decode
+            )
+
+    def iter_all(
+        self,
+        per_page: int = DEFAULT_PAGE_SIZE,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Webhook]:
+        """
+        Iterate over all webhooks, across every page.
+
+        The next page is fetched in the background while the current one is
+        being consumed.
+
+        Args:
+            per_page: Items per page (1-100, default: 100)
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Yields:
+            Webhooks, in list order (use with ``async for``)
+        """
+        return aiter_pages(
+            lambda page: self.list(page=page, per_page=per_page, timeout=timeout)  # type: ignore
+        )
+
+    async def get(self, id: str, timeout: Optional[float] = None) -> ApiResponse[Webhook]:
+        """
+        Get a webhook by ID.
+
+        Args:
+            id: Webhook UUID
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            Webhook details
+        """
+        async with self._bulkhead:
+            return await self._get(f"/v1/webhooks/{id}", timeout=timeout)  # type: ignore
+
+    async def create(
+        self,
+        name: str,
+        url: str,
+        events: List[WebhookEvent],
+        metadata: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> ApiResponse[Webhook]:
+        """
+        Create a new webhook.
+
+        The webhook secret is returned in the response - store it securely
+        to verify webhook signatures.
+
+        Args:
+            name: Webhook name
+            url: Webhook endpoint URL
+            events: List of events to subscribe to
+            metadata: Optional custom metadata to attach to the webhook
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            Created webhook (includes secret)
+
+        Raises:
+            ValueError: If an event is not a known webhook event
+        """
+        check_choices("event", events, WEBHOOK_EVENTS)
+        data: Dict[str, Any] = {
+            "name": name,
+            "url": url,
+            "events": events,
+        }
+        if metadata is not None:
+            data["metadata"] = metadata
+        async with self._bulkhead:
+            return await self._post(  # type: ignore
+                "/v1/webhooks", json=data, timeout=timeout
+            )
+
+    async def update(
+        self,
+        id: str,
+        name: Optional[str] = None,
+        url: Optional[str] = None,
+        events: Optional[List[WebhookEvent]] = None,
+        is_active: Optional[bool] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> ApiResponse[Webhook]:
+        """
+        Update a webhook.
+
+        Args:
+            id: Webhook UUID
+            name: New webhook name
+            url: New webhook URL
+            events: New list of events
+            is_active: Whether the webhook is active
+            metadata: Custom metadata to attach to the webhook
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            Updated webhook
+
+        Raises:
+            ValueError: If an event is not a known webhook event
+        """
+        check_choices("event", events, WEBHOOK_EVENTS)
+        data: Dict[str, Any] = {}
+        for key, value in (
+            ("name", name),
+            ("url", url),
+            ("events", events),
+            ("is_active", is_active),
+            ("metadata", metadata),
+        ):
+            if value is not None:
+                data[key] = value
+        async with self._bulkhead:
+            return await self._put(  # type: ignore
+                f"/v1/webhooks/{id}", json=data, timeout=timeout
+            )
+
+    async def delete(self, id: str, timeout: Optional[float] = None) -> None:
+        """
+        Delete a webhook.
+
+        Args:
+            id: Webhook UUID
+            timeout: Request timeout in seconds (default: the client's timeout)
+        """
+        async with self._bulkhead:
+            await self._delete(f"/v1/webhooks/{id}", timeout=timeout)
+
+    @overload
+    async def list_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        event_type: Optional[WebhookEvent] = ...,
+        status: Optional[WebhookDeliveryStatus] = ...,
+        paginate: Optional[Literal[True]] = ...,
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> ListResponse[WebhookDelivery]: ...
+
+    @overload
+    async def list_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        event_type: Optional[WebhookEvent] = ...,
+        status: Optional[WebhookDeliveryStatus] = ...,
+        *,
+        paginate: Literal[False],
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> UnpaginatedListResponse[WebhookDelivery]: ...
+
+    @overload
+    async def list_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        event_type: Optional[WebhookEvent] = ...,
+        status: Optional[WebhookDeliveryStatus] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        lazy: Literal[False] = ...,
+    ) -> Union[ListResponse[WebhookDelivery], UnpaginatedListResponse[WebhookDelivery]]: ...
+
+    @overload
+    async def list_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        event_type: Optional[WebhookEvent] = ...,
+        status: Optional[WebhookDeliveryStatus] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        *,
+        lazy: Literal[True],
+    ) -> LazyListResponse[WebhookDelivery]: ...
+
+    @overload
+    async def list_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        event_type: Optional[WebhookEvent] = ...,
+        status: Optional[WebhookDeliveryStatus] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+        lazy: bool = ...,
+    ) -> Union[
+        ListResponse[WebhookDelivery],
+        UnpaginatedListResponse[WebhookDelivery],
+        LazyListResponse[WebhookDelivery],
+    ]: ...
+
+    async def list_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        event_type: Optional[WebhookEvent] = None,
+        status: Optional[WebhookDeliveryStatus] = None,
+        paginate: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        lazy: bool = False,
+    ) -> Union[
+        ListResponse[WebhookDelivery],
+        UnpaginatedListResponse[WebhookDelivery],
+        LazyListResponse[WebhookDelivery],
+    ]:
+        """
+        List webhook deliveries.
+
+        Args:
+            webhook_id: Webhook UUID
+            page: Page number (1-indexed, default: 1)
+            per_page: Items per page (1-100, default: 20)
+            event_type: Filter by event type
+            status: Filter by delivery status ("pending", "delivered" or "failed")
+            paginate: Set to False to skip pagination metadata. The server
+                then doesn't count the full result set, which makes large
+                listings cheaper when only the next page of items is needed.
+            timeout: Request timeout in seconds (default: the client's timeout)
+            lazy: Return a ``LazyListResponse``, which only decodes the items
+                that are accessed (default: False)
+
+        Returns:
+            Paginated list of delivery attempts (without ``pagination`` if
+            ``paginate`` is False); a ``LazyListResponse`` if ``lazy`` is True
+
+        Raises:
+            ValueError: If ``event_type`` or ``status`` is not a known value
+        """
+        check_choice("event_type", event_type, WEBHOOK_EVENTS)
+        check_choice("status", status, WEBHOOK_DELIVERY_STATUSES)
+        params: Dict[str, Any] = {
+            "page": page,
+            "per_page": per_page,
+            "event_type": event_type,
+            "status": status,
+            "pagination": "false" if paginate is False else None,
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        decode = LazyListResponse if lazy else None
+        async with self._bulkhead:
+            return await self._get(  # type: ignore
+                f"/v1/webhooks/{webhook_id}/deliveries",
+                params=params,
+                timeout=timeout,
+                decode=decode,
+            )
+
+    @overload
+    async def list_failed_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        event_type: Optional[WebhookEvent] = ...,
+        paginate: Optional[Literal[True]] = ...,
+        timeout: Optional[float] = ...,
+    ) -> ListResponse[WebhookDelivery]: ...
+
+    @overload
+    async def list_failed_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        event_type: Optional[WebhookEvent] = ...,
+        *,
+        paginate: Literal[False],
+        timeout: Optional[float] = ...,
+    ) -> UnpaginatedListResponse[WebhookDelivery]: ...
+
+    @overload
+    async def list_failed_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = ...,
+        per_page: Optional[int] = ...,
+        event_type: Optional[WebhookEvent] = ...,
+        paginate: Optional[bool] = ...,
+        timeout: Optional[float] = ...,
+    ) -> Union[ListResponse[WebhookDelivery], UnpaginatedListResponse[WebhookDelivery]]: ...
+
+    async def list_failed_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        event_type: Optional[WebhookEvent] = None,
+        paginate: Optional[bool] = None,
+        timeout: Optional[float] = None,
+    ) -> Union[ListResponse[WebhookDelivery], UnpaginatedListResponse[WebhookDelivery]]:
+        """
+        List deliveries that failed permanently.
+
+        Together with ``replay_delivery`` this works as a dead-letter queue:
+        after an outage on the receiving end, list what failed and replay it
+        instead of re-creating the events.
+
+        Args:
+            webhook_id: Webhook UUID
+            page: Page number (1-indexed, default: 1)
+            per_page: Items per page (1-100, default: 20)
+            event_type: Filter by event type
+            paginate: Set to False to skip pagination metadata
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            Paginated list of failed delivery attempts
+
+        Raises:
+            ValueError: If ``event_type`` is not a known webhook event
+        """
+        return await self.list_deliveries(
+            webhook_id,
+            page=page,
+            per_page=per_page,
+            event_type=event_type,
+            status="failed",
+            paginate=paginate,
+            timeout=timeout,
+        )
+
+    def list_deliveries_iter(
+        self,
+        webhook_id: str,
+        per_page: int = DEFAULT_PAGE_SIZE,
+        event_type: Optional[WebhookEvent] = None,
+        status: Optional[WebhookDeliveryStatus] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[WebhookDelivery]:
+        """
+        Iterate over all deliveries of a webhook, across every page.
+
+        Useful for auditing a webhook's full delivery history. The next page
+        is fetched in the background while the current one is being consumed.
+
+        Args:
+            webhook_id: Webhook UUID
+            per_page: Items per page (1-100, default: 100)
+            event_type: Filter by event type
+            status: Filter by delivery status ("pending", "delivered" or "failed")
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Yields:
+            Delivery attempts, in list order (use with ``async for``)
+
+        Raises:
+            ValueError: If ``event_type`` or ``status`` is not a known value
+        """
+        check_choice("event_type", event_type, WEBHOOK_EVENTS)
+        check_choice("status", status, WEBHOOK_DELIVERY_STATUSES)
+        return aiter_pages(
+            lambda page: self.list_deliveries(
+                webhook_id,
+                page=page,
+                per_page=per_page,
+                event_type=event_type,
+                status=status,
+                timeout=timeout,
+            )  # type: ignore
+        )
+
+    def stream_deliveries(
+        self,
+        webhook_id: str,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        event_type: Optional[WebhookEvent] = None,
+        status: Optional[WebhookDeliveryStatus] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[WebhookDelivery]:
+        """
+        Stream one page of webhook deliveries.
+
+        Unlike ``list_deliveries``, the response is parsed as it arrives and
+        each delivery is yielded as soon as it has been read, so large pages
+        never have to be held in memory at once. Requires ijson
+        (``pip install workbench-sdk[speedups]``) for incremental parsing;
+        without it the page is read in full before the first delivery is
+        yielded. Streamed requests are not retried.
+
+        A concurrency slot is only held while the request is being sent, so
+        it is safe to make other calls through this resource while iterating.
+
+        Args:
+            webhook_id: Webhook UUID
+            page: Page number (1-indexed, default: 1)
+            per_page: Items per page (1-100, default: 20)
+            event_type: Filter by event type
+            status: Filter by delivery status ("pending", "delivered" or "failed")
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Yields:
+            Delivery attempts, in list order (use with ``async for``)
+
+        Raises:
+            ValueError: If ``event_type`` or ``status`` is not a known value
+        """
+        check_choice("event_type", event_type, WEBHOOK_EVENTS)
+        check_choice("status", status, WEBHOOK_DELIVERY_STATUSES)
+        params: Dict[str, Any] = {
+            "page": page,
+            "per_page": per_page,
+            "event_type": event_type,
+            "status": status,
+        }
+        return self._stream_deliveries(webhook_id, params, timeout)
+
+    async def _stream_deliveries(
+        self, webhook_id: str, params: Dict[str, Any], timeout: Optional[float]
+    ) -> AsyncIterator[WebhookDelivery]:
+        async with AsyncExitStack() as stack:
+            async with self._bulkhead:
+                response = await stack.enter_async_context(
+                    self._client.stream(
+                        "GET",
+                        f"/v1/webhooks/{webhook_id}/deliveries",
+                        params=params,
+                        timeout=timeout,
+                    )
+                )
+            async for delivery in aiter_array_items(response.aiter_bytes(), "data"):
+                yield delivery
+
+    async def get_delivery(
+        self,
+        webhook_id: str,
+        delivery_id: str,
+        timeout: Optional[float] = None,
+    ) -> ApiResponse[WebhookDelivery]:
+        """
+        Get a single webhook delivery.
+
+        Returns details about a specific delivery attempt, including
+        request/response headers and timing information.
+
+        Args:
+            webhook_id: Webhook UUID
+            delivery_id: Delivery UUID
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            Delivery details
+        """
+        async with self._bulkhead:
+            return await self._get(  # type: ignore
+                f"/v1/webhooks/{webhook_id}/deliveries/{delivery_id}", timeout=timeout
+            )
+
+    async def replay_delivery(
+        self,
+        webhook_id: str,
+        delivery_id: str,
+        timeout: Optional[float] = None,
+    ) -> ApiResponse[WebhookDelivery]:
+        """
+        Replay a webhook delivery.
+
+        Sends the original event payload to the webhook URL again, as a new
+        delivery attempt.
+
+        Args:
+            webhook_id: Webhook UUID
+            delivery_id: UUID of the delivery to replay
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            The new delivery attempt
+        """
+        async with self._bulkhead:
+            return await self._post(  # type: ignore
+                f"/v1/webhooks/{webhook_id}/deliveries/{delivery_id}/replay", timeout=timeout
+            )
+
+    async def replay_deliveries_concurrent(
+        self,
+        deliveries: List[WebhookDelivery],
+        max_per_url: int = 1,
+        max_total: int = DEFAULT_REPLAY_MAX_TOTAL,
+        timeout: float = DEFAULT_REPLAY_TIMEOUT,
+    ) -> List[Union[ApiResponse[WebhookDelivery], "WorkbenchError"]]:
+        """
+        Replay many deliveries concurrently, grouped by webhook URL.
+
+        Replays to the same URL run at most ``max_per_url`` at a time, while
+        different URLs are replayed in parallel. A slow or failing endpoint
+        therefore only holds up its own deliveries, and the whole batch takes
+        about as long as the slowest URL instead of the sum of all of them.
+        Each webhook is fetched once to look up its URL.
+
+        Args:
+            deliveries: Deliveries to replay (e.g. from ``list_failed_deliveries``)
+            max_per_url: Maximum concurrent replays per webhook URL
+            max_total: Maximum concurrent replays overall (default: 32).
+                Every call also counts against the client's
+                ``max_concurrency`` and ``max_concurrent_per_resource``
+                limits; raise those to run more replays at once
+            timeout: Timeout in seconds for each API call (default: 10)
+
+        Returns:
+            One result per delivery, in input order: the new delivery attempt,
+            or the ``WorkbenchError`` that replaying it raised
+        """
+        from workbench.client import WorkbenchError
+
+        results: List[Any] = [None] * len(deliveries)
+        urls: Dict[str, Any] = {}
+
+        async def fetch_url(webhook_id: str) -> None:
+            try:
+                webhook = await self.get(webhook_id, timeout=timeout)
+                urls[webhook_id] = webhook["data"]["url"]
+            except WorkbenchError as e:
+                urls[webhook_id] = e
+
+        await asyncio.gather(*(fetch_url(id) for id in {d["webhook_id"] for d in deliveries}))
+
+        groups: Dict[str, List[int]] = defaultdict(list)
+        for index, delivery in enumerate(deliveries):
+            url = urls[delivery["webhook_id"]]
+            if isinstance(url, WorkbenchError):
+                results[index] = url
+            else:
+                groups[url].append(index)
+
+        total = asyncio.Semaphore(max_total)
+
+        async def process_group(indices: List[int]) -> None:
+            per_url = asyncio.Semaphore(max_per_url)
+
+            async def replay(index: int) -> None:
+                delivery = deliveries[index]
+                # Take the URL slot first so queued replays don't hold total slots
+                async with per_url, total:
+                    try:
+                        results[index] = await self.replay_delivery(
+                            delivery["webhook_id"], delivery["id"], timeout=timeout
+                        )
+                    except WorkbenchError as e:
+                        results[index] = e
+
+            await asyncio.gather(*(replay(index) for index in indices))
+
+        await asyncio.gather(*(process_group(indices) for indices in groups.values()))
+        return results
+
+    async def test(self, id: str, timeout: Optional[float] = None) -> ApiResponse[Dict[str, str]]:
+        """
+        Send a test webhook.
+
+        Args:
+            id: Webhook UUID
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            Test delivery result with message and delivery_id
+        """
+        async with self._bulkhead:
+            return await self._post(  # type: ignore
+                f"/v1/webhooks/{id}/test", timeout=timeout
+            )
+
+    async def regenerate_secret(
+        self,
+        id: str,
+        timeout: Optional[float] = None,
+    ) -> ApiResponse[WebhookSecretResponse]:
+        """
+        Regenerate webhook secret.
+
+        Generates a new secret for the webhook. The old secret will
+        immediately stop working. Make sure to update your webhook
+        handler with the new secret.
+
+        Args:
+            id: Webhook UUID
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            New webhook secret
+        """
+        async with self._bulkhead:
+            return await self._post(  # type: ignore
+                f"/v1/webhooks/{id}/secret", timeout=timeout
+            )
+
+    async def list_event_types(
+        self,
+        timeout: Optional[float] = None,
+    ) -> ApiResponse[List[WebhookEventTypeInfo]]:
+        """
+        List available webhook event types.
+
+        Returns all event types that can be subscribed to, with
+        descriptions and categories.
+
+        Args:
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            List of available event types with descriptions
+        """
+        async with self._bulkhead:
+            return await self._get(  # type: ignore
+                "/v1/webhooks/event-types", timeout=timeout
+            )
+
+    async def bulk_create(
+        self,
+        items: List[CreateWebhookParams],
+        timeout: Optional[float] = None,
+    ) -> BulkResponse[Webhook]:
+        """
+        Create multiple webhooks in a single API call.
+
+        Items are processed independently: a failing item does not roll back
+        the others. Check each result's ``status`` to find partial failures.
+        Each successful result includes the new webhook's secret - store it
+        securely.
+
+        Args:
+            items: Webhooks to create (same fields as ``create``)
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            One result per item, in the same order as ``items``
+
+        Raises:
+            ValueError: If an event is not a known webhook event
+        """
+        for item in items:
+            check_choices("event", item.get("events"), WEBHOOK_EVENTS)
+        data = {"items": [{k: v for k, v in item.items() if v is not None} for item in items]}
+        async with self._bulkhead:
+            return await self._post(  # type: ignore
+                "/v1/webhooks/bulk", json=data, timeout=timeout
+            )
+
+    async def bulk_update(
+        self,
+        updates: List[Dict[str, Any]],
+        timeout: Optional[float] = None,
+    ) -> BulkResponse[Webhook]:
+        """
+        Update multiple webhooks in a single API call.
+
+        Items are processed independently: a failing item does not roll back
+        the others. Check each result's ``status`` to find partial failures.
+
+        Args:
+            updates: Updates to apply; each dict must contain the webhook ``id``
+                plus the fields to update
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            One result per update, in the same order as ``updates``
+
+        Raises:
+            ValueError: If an update is missing its ``id``, or an event is not a
+                known webhook event
+        """
+        if any(not update.get("id") for update in updates):
+            raise ValueError("Each update must include an 'id'")
+        for update in updates:
+            check_choices("event", update.get("events"), WEBHOOK_EVENTS)
+        data = {
+            "items": [{k: v for k, v in update.items() if v is not None} for update in updates]
+        }
+        async with self._bulkhead:
+            return await self._put(  # type: ignore
+                "/v1/webhooks/bulk", json=data, timeout=timeout
+            )
+
+    async def bulk_delete(
+        self,
+        ids: List[str],
+        timeout: Optional[float] = None,
+    ) -> BulkResponse[None]:
+        """
+        Delete multiple webhooks in a single API call.
+
+        Items are processed independently: a failing item does not roll back
+        the others. Check each result's ``status`` to find partial failures.
+
+        Args:
+            ids: Webhook UUIDs
+            timeout: Request timeout in seconds (default: the client's timeout)
+
+        Returns:
+            One result per ID, in the same order as ``ids``
+        """
+        async with self._bulkhead:
+            return await self._post(  # type: ignore
+                "/v1/webhooks/bulk/delete", json={"ids": ids}, timeout=timeout
+            )
@@ -6,9 +6,23 @@ full type safety when working with the Workbench API.
 """
 
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Literal, Optional, TypedDict, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    TypedDict,
+    TypeVar,
+    get_args,
+)
 from typing_extensions import NotRequired
 
+from workbench._json import loads_deferred_array
+
 # ===========================================
 # GENERIC TYPES
 # ===========================================
@@ -56,6 +70,123 @@ class ListResponse(TypedDict, Generic[T]):
     pagination: Pagination
 
 
+class UnpaginatedListResponse(TypedDict, Generic[T]):
+    """
+    API response wrapper for lists requested with ``paginate=False``.
+
+    The server skips counting the full result set, so no pagination
+    metadata is returned.
+    """
+
+    data: List[T]
+    meta: ResponseMeta
+
+
+class LazyList(Sequence[T]):
+    """
+    Read-only list whose items stay JSON-encoded until they are accessed.
+
+    Each item is decoded on first access and then kept, so reading an item
+    twice decodes it once.
+    """
+
+    def __init__(self, items: List[Any], decode: Callable[[Any], T]):
+        self._encoded = items
+        self._decode = decode
+        self._decoded: Dict[int, T] = {}
+
+    def __len__(self) -> int:
+        return len(self._encoded)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        if not -len(self) <= index < len(self):
+            raise IndexError("list index out of range")
+        index %= len(self)
+        try:
+            return self._decoded[index]
+        except KeyError:
+            item = self._decoded[index] = self._decode(self._encoded[index])
+            return item
+
+    def __repr__(self) -> str:
+        return f"LazyList({len(self)} items, {len(self._decoded)} decoded)"
+
+
+class LazyListResponse(Generic[T]):
+    """
+    List response whose items are only decoded when accessed.
+
+    Returned by ``list`` methods called with ``lazy=True``. Useful when only
+    a few items of a large page are read (e.g. a preview), since the others
+    are never decoded. Needs msgspec (``pip install workbench-sdk[speedups]``);
+    without it the whole response is decoded up front.
+
+    Supports ``response["data"]``-style access like ``ListResponse``; call
+    ``dict()`` for a plain, fully decoded ``ListResponse``.
+
+    Args:
+        raw: Raw JSON response body
+    """
+
+    def __init__(self, raw: bytes):
+        fields, items, decode = loads_deferred_array(raw, "data")
+        self._fields = fields
+        self.data: LazyList[T] = LazyList(items, decode)
+
+    @property
+    def meta(self) -> ResponseMeta:
+        """Response metadata."""
+        return self._fields.get("meta")  # type: ignore[return-value]
+
+    @property
+    def pagination(self) -> Optional[Pagination]:
+        """Pagination information (None if requested with ``paginate=False``)."""
+        return self._fields.get("pagination")
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "data":
+            return self.data
+        return self._fields[key]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def dict(self) -> Dict[str, Any]:
+        """Decode every item and return the response as a plain dict."""
+        return {**self._fields, "data": list(self.data)}
+
+
+class BulkItemError(TypedDict):
+    """Error details for a single item of a bulk operation."""
+
+    code: str
+    message: str
+
+
+class BulkItemResult(TypedDict, Generic[T]):
+    """Outcome of a single item of a bulk operation."""
+
+    index: int  # Position of the item in the request payload
+    id: Optional[str]  # Record ID (None when a create failed)
+    status: Literal["success", "error"]
+    data: NotRequired[T]  # Present when status is "success"
+    error: NotRequired[BulkItemError]  # Present when status is "error"
+
+
+class BulkResponse(TypedDict, Generic[T]):
+    """
+    API response wrapper for bulk operations.
+
+    Bulk operations are not atomic: each item succeeds or fails on its own,
+    and ``data`` holds one result per input item, in request order.
+    """
+
+    data: List[BulkItemResult[T]]
+    meta: ResponseMeta
+
+
 # ===========================================
 # CLIENT TYPES
 # ===========================================
@@ -406,6 +537,10 @@ ServiceRequestStatus = Literal[
 ]
 ServiceRequestPriority = Literal["low", "medium", "high", "urgent"]
 
+# Allowed values, for validating arguments before a request is sent
+SERVICE_REQUEST_STATUSES = frozenset(get_args(ServiceRequestStatus))
+SERVICE_REQUEST_PRIORITIES = frozenset(get_args(ServiceRequestPriority))
+
 
 class ServiceRequest(TypedDict):
     """Service request record."""
@@ -480,6 +615,7 @@ class ListServiceRequestsParams(TypedDict, total=False):
     status: ServiceRequestStatus
     priority: ServiceRequestPriority
     client_id: str
+    paginate: bool  # False skips pagination metadata (and the server-side count)
 
 
 # ===========================================
@@ -520,6 +656,9 @@ WebhookEvent = Literal[
     "service_request.completed",
 ]
 
+# Allowed values, for validating arguments before a request is sent
+WEBHOOK_EVENTS = frozenset(get_args(WebhookEvent))
+
 WebhookEventCategory = Literal[
     "client", "invoice", "quote", "job", "service_request"
 ]
@@ -545,6 +684,12 @@ class Webhook(TypedDict):
     updated_at: Optional[str]
 
 
+WebhookDeliveryStatus = Literal["pending", "delivered", "failed"]
+
+# Allowed values, for validating arguments before a request is sent
+WEBHOOK_DELIVERY_STATUSES = frozenset(get_args(WebhookDeliveryStatus))
+
+
 class WebhookDelivery(TypedDict):
     """Webhook delivery record."""
 
@@ -594,7 +739,8 @@ class ListWebhookDeliveriesParams(TypedDict, total=False):
     limit: int
     offset: int
     event_type: WebhookEvent
-    status: Literal["pending", "delivered", "failed"]
+    status: WebhookDeliveryStatus
+    paginate: bool  # False skips pagination metadata (and the server-side count)
 
 
 class WebhookSecretResponse(TypedDict):